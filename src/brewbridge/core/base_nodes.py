@@ -11,13 +11,13 @@ def tool_node(func):
     @wraps(func)
     def wrapper(state: MigrationGraphState) -> MigrationGraphState:
         name = func.__name__
-        logger.info(f"🧩 [TOOL] Running: {name}")
+        logger.info("🧩 [TOOL] Running: {}", name)
         try:
             out = func(state)
-            logger.info(f"🟩 [TOOL] Completed: {name}")
+            logger.info("🟩 [TOOL] Completed: {}", name)
             return out
         except Exception as e:
-            logger.error(f"🟥 [TOOL] Failed: {name} | {e}")
+            logger.error("🟥 [TOOL] Failed: {} | {}", name, e)
             raise
 
     return wrapper
@@ -27,13 +27,13 @@ def agent_node(func):
     @wraps(func)
     def wrapper(state: MigrationGraphState) -> MigrationGraphState:
         name = func.__name__
-        logger.info(f"🤖 [AGENT] Running: {name}")
+        logger.info("🤖 [AGENT] Running: {}", name)
         try:
             out = func(state)
-            logger.info(f"🟦 [AGENT] Completed: {name}")
+            logger.info("🟦 [AGENT] Completed: {}", name)
             return out
         except Exception as e:
-            logger.error(f"🟥 [AGENT] Failed: {name} | {e}")
+            logger.error("🟥 [AGENT] Failed: {} | {}", name, e)
             raise
 
     return wrapper
@@ -43,13 +43,13 @@ def human_node(func):
     @wraps(func)
     def wrapper(state: MigrationGraphState) -> MigrationGraphState:
         name = func.__name__
-        logger.info(f"🧍 [HUMAN] Awaiting: {name}")
+        logger.info("🧍 [HUMAN] Awaiting: {}", name)
         try:
             out = func(state)
-            logger.info(f"🟫 [HUMAN] Completed: {name}")
+            logger.info("🟫 [HUMAN] Completed: {}", name)
             return out
         except Exception as e:
-            logger.error(f"🟥 [HUMAN] Failed: {name} | {e}")
+            logger.error("🟥 [HUMAN] Failed: {} | {}", name, e)
             raise
 
     return wrapper
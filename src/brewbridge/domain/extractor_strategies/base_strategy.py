@@ -18,7 +18,7 @@ class BaseExtractorStrategy(ABC):
         DO NOT OVERRIDE this method in subclasses unless strictly necessary.
         """
         strategy_name = self.__class__.__name__
-        logger.info(f"[{strategy_name}] Starting extraction process...")
+        logger.info("[%s] Starting extraction process...", strategy_name)
 
         try:
             # Validación de entradas
@@ -30,11 +30,11 @@ class BaseExtractorStrategy(ABC):
             # Normalización de salida
             normalized_data = self.normalize_output(raw_artifacts)
 
-            logger.info(f"✅ [{strategy_name}] Extraction completed successfully.")
+            logger.info("✅ [%s] Extraction completed successfully.", strategy_name)
             return normalized_data
 
         except Exception as e:
-            logger.error(f"Critical error in {strategy_name}: {e}")
+            logger.error("Critical error in %s: %s", strategy_name, e)
             # Re-lanzamos como error de dominio para que el Grafo lo maneje
             raise ExtractionError(f"Fallo en estrategia {strategy_name}: {e}") from e
 
@@ -0,0 +1 @@
+"""Extraction strategies for BrewDat framework pipelines."""
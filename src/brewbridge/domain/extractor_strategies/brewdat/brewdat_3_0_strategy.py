@@ -45,7 +45,7 @@ class Brewdat3Strategy(BaseExtractorStrategy):
         # Inferencia del nombre del repo de Databricks (ADB)
         repo_adb = repo_adf.replace("-repo-adf", "-repo-adb")
 
-        logger.info(f" || Repositorios detectados -> ADF: {repo_adf} | ADB: {repo_adb}")
+        logger.info(" || Repositorios detectados -> ADF: %s | ADB: %s", repo_adf, repo_adb)
 
         artifacts = {
             "notebooks_source": {},  # Dic {path: content}
@@ -70,7 +70,7 @@ class Brewdat3Strategy(BaseExtractorStrategy):
             pipe_content = self.client.get_file(repo_adf, pipeline_path)
             artifacts["pipeline_json"] = json.loads(pipe_content)
         except (KeyError, IndexError) as e:
-            logger.warning(f"No se pudo extraer el pipelineReference del trigger: {e}")
+            logger.warning("No se pudo extraer el pipelineReference del trigger: %s", e)
 
         # C. Global Parameters
         artifacts["global_parameters"] = self._fetch_global_parameters(repo_adf)
@@ -81,7 +81,7 @@ class Brewdat3Strategy(BaseExtractorStrategy):
 
         # Guardamos la lista de objetos como diccionarios para serialización en el State
         artifacts["items"] = [item.model_dump() for item in migration_items]
-        logger.info(f" Identificadas {len(migration_items)} tablas para migrar.")
+        logger.info(" Identificadas %d tablas para migrar.", len(migration_items))
 
         # || Código (Notebooks Deduplicados)
         logger.info("Fase 3: Descarga de Código (Notebooks)")
@@ -93,35 +93,42 @@ class Brewdat3Strategy(BaseExtractorStrategy):
             if item.notebook_path_slv:
                 unique_scripts.add(item.notebook_path_slv)
 
-        logger.info(f" Scripts únicos a descargar: {len(unique_scripts)}")
+        logger.info(" Scripts únicos a descargar: %d", len(unique_scripts))
 
-        for script_path in unique_scripts:
-            try:
-                code = self.client.get_file(repo_adb, script_path)
-                artifacts["notebooks_source"][script_path] = code
-            except Exception as e:
-                logger.error(f" Error descargando script {script_path}: {e}")
-                artifacts["notebooks_source"][script_path] = f"# ERROR: {e}"
+        # One batched request per 50 scripts instead of one request per script.
+        sources = self.client.get_files(repo_adb, sorted(unique_scripts), return_exceptions=True)
+        for script_path, content in sources.items():
+            if isinstance(content, Exception):
+                logger.error(" Error descargando script %s: %s", script_path, content)
+                content = f"# ERROR: {content}"
+            artifacts["notebooks_source"][script_path] = content
 
         # Calidad (Governance IF SLV )
         logger.info("--- Fase 4: Descarga de Reglas de Calidad (Governance) ---")
+        silver_items = [item for item in migration_items if item.has_silver]
+        logger.info(" Tablas Silver con reglas DQ a buscar: %d", len(silver_items))
+        if not silver_items:
+            return artifacts
+
         global_params_vals = self._extract_params_values(artifacts["global_parameters"])
 
-        for item in migration_items:
-            if item.has_silver:
-                try:
-                    gov_path = self._build_governance_path(item, global_params_vals)
-                    logger.debug(f"Buscando reglas DQ para {item.table_name}: {gov_path}")
+        # Index the serialized items once instead of rescanning them per table.
+        items_by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for dict_item in artifacts["items"]:
+            items_by_table.setdefault(dict_item["table_name"], []).append(dict_item)
 
-                    yaml_content = self.client.get_file(self.GOVERNANCE_REPO, gov_path)
-                    artifacts["quality_rules"][item.table_name] = yaml_content
+        gov_paths = [self._build_governance_path(item, global_params_vals) for item in silver_items]
+        rules = self.client.get_files(self.GOVERNANCE_REPO, gov_paths, return_exceptions=True)
 
-                    for dict_item in artifacts["items"]:
-                        if dict_item["table_name"] == item.table_name:
-                            dict_item["governance_path"] = gov_path
+        for item, gov_path in zip(silver_items, gov_paths):
+            yaml_content = rules[gov_path]
+            if isinstance(yaml_content, Exception):
+                logger.warning("⚠️ No hay reglas DQ para %s o ruta inválida.", item.table_name)
+                continue
 
-                except Exception as e:
-                    logger.warning(f"⚠️ No hay reglas DQ para {item.table_name} o ruta inválida.")
+            artifacts["quality_rules"][item.table_name] = yaml_content
+            for dict_item in items_by_table[item.table_name]:
+                dict_item["governance_path"] = gov_path
 
         return artifacts
 
@@ -147,7 +154,7 @@ class Brewdat3Strategy(BaseExtractorStrategy):
                     return json.loads(self.client.get_file(repo, f["path"]))
 
         except Exception as e:
-            logger.warning(f"No se pudieron cargar Global Parameters: {e}")
+            logger.warning("No se pudieron cargar Global Parameters: %s", e)
 
         return {}
 
@@ -184,7 +191,7 @@ class Brewdat3Strategy(BaseExtractorStrategy):
                 parsed.append(item)
 
         except Exception as e:
-            logger.error(f"Error parseando estructura del Trigger: {e}")
+            logger.error("Error parseando estructura del Trigger: %s", e)
             raise ExtractionError("El formato del Trigger no coincide con el estándar esperado.")
 
         return parsed
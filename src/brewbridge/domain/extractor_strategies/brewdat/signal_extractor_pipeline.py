@@ -1,12 +1,29 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from brewbridge.infrastructure import get_logger
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _load_embedded_yaml(content: str) -> Any:
+    """
+    Parse a YAML document carried as a string inside raw_artifacts.
+
+    The same manifest/metadata text is consulted for every table, so parses
+    are cached by content. Callers must treat the result as read-only.
+    """
+    return yaml.load(content, Loader=_SafeLoader)
+
+
 class BrewdatSignalExtractor:
     """
     Deterministic signal extraction for BrewDat 3.0 artifacts focused on a
@@ -62,12 +79,16 @@ class BrewdatSignalExtractor:
             self._derive_cron(trigger) if self._is_schedule_trigger(trigger) else (None, None)
         )
         schedule = cron_val if cron_val else schedule_raw
+        # Both signals come from pipeline-level documents, so they are the same for every table.
+        acl = "y" if self._has_access_groups(raw_artifacts) else "n"
+        connection_id = self._extract_connection_id(raw_artifacts)
 
         tables, counts = self._build_tables(
             items=items,
             zone=zone,
             domain=domain,
-            raw_artifacts=raw_artifacts,
+            acl=acl,
+            connection_id=connection_id,
             schedule=schedule,
         )
 
@@ -95,7 +116,8 @@ class BrewdatSignalExtractor:
         items: List[Dict[str, Any]],
         zone: str,
         domain: str,
-        raw_artifacts: Dict[str, Any],
+        acl: str,
+        connection_id: str,
         schedule: str,
     ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
         tables: Dict[str, Dict[str, Any]] = {}
@@ -118,7 +140,8 @@ class BrewdatSignalExtractor:
                 domain=domain,
                 source_system_fallback=None,
                 country_fallback=None,
-                raw_artifacts=raw_artifacts,
+                acl=acl,
+                connection_id=connection_id,
                 schedule=schedule,
             )
 
@@ -142,7 +165,8 @@ class BrewdatSignalExtractor:
         domain: str,
         source_system_fallback: Optional[str],
         country_fallback: Optional[str],
-        raw_artifacts: Dict[str, Any],
+        acl: str,
+        connection_id: str,
         schedule: str,
     ) -> Dict[str, Any]:
         zone_local = cfg.get("target_zone") or zone
@@ -168,8 +192,6 @@ class BrewdatSignalExtractor:
             table_name = cfg.get("target_table") or cfg.get("source_table") or target_entity
 
         transformations = "y" if target_layer == "slv" else "n"
-        acl = "y" if self._has_access_groups(raw_artifacts) else "n"
-        connection_id = self._extract_connection_id(raw_artifacts)
 
         return {
             "target_layer": target_layer,
@@ -268,7 +290,7 @@ class BrewdatSignalExtractor:
 
         try:
             manifest = (
-                yaml.safe_load(manifest_content)
+                _load_embedded_yaml(manifest_content)
                 if isinstance(manifest_content, str)
                 else manifest_content
             )
@@ -286,7 +308,7 @@ class BrewdatSignalExtractor:
             return False
         try:
             metadata = (
-                yaml.safe_load(metadata_content)
+                _load_embedded_yaml(metadata_content)
                 if isinstance(metadata_content, str)
                 else metadata_content
             )
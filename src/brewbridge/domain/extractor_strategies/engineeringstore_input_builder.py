@@ -3,6 +3,59 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict
 
+# Answers to the interactive `--create-template-files` prompts, one per line.
+# Parsed once at import; `build` only fills them in with `str.format_map`.
+_BRZ_PROMPT_TEMPLATE = (
+    "{zone}\n{landing_zone}\n{country}\n{domain}\n{pipeline}\n{schedule}\n{table_name}\n"
+    "{owner}\n{connector}\n{source_system}\n{source_entity}\n{target_entity}\n"
+    "{connection_id}\nn{acl}\n"
+)
+_SLV_PROMPT_TEMPLATE = (
+    "{zone}\n{landing_zone}\n{country}\n{domain}\n{pipeline}\n{schedule}\n{table_name}\n"
+    "{owner}\n{connector}\n{source_system}\n{source_entity}\n{target_entity}\n"
+    "{connection_id}\n{transformations}{acl}\n"
+)
+_GLD_PROMPT_TEMPLATE = (
+    "{zone}\n{landing_zone}\n{country}\n{domain}\n{pipeline}\n{schedule}\n{table_name}\n"
+    "{owner}\n{table_scope}\n\n{data_product_subdomain}\n{acl}{trigger}\n"
+)
+
+_HOPSFLOW_DEFAULTS = {
+    "zone": "maz",
+    "country": "",
+    "domain": "unknown",
+    "schedule": "* * * * *",
+    "table_name": "raw_table",
+    "owner": "platform",
+    "connector": "blob",
+    "source_system": "sap",
+    "source_entity": "sap",
+    "target_entity": "sap",
+    "connection_id": "sap-secret",
+    "transformations": "y",
+    "acl": "n",
+}
+_BREWTIFUL_DEFAULTS = {
+    "zone": "maz",
+    "country": "mz",
+    "domain": "unknown",
+    "schedule": "* * * * *",
+    "table_name": "feature_table",
+    "owner": "platform",
+    "table_scope": "transformation",
+    "data_product_subdomain": "default",
+    "acl": "n",
+    "trigger": "n",
+}
+
+
+def _prompt_values(schema: Dict, metadata: Dict, defaults: Dict[str, str]) -> Dict:
+    """Merge defaults and schema once so templates index a plain dict."""
+    values = {**defaults, **schema}
+    values.setdefault("landing_zone", values["zone"])
+    values["pipeline"] = metadata.get("pipeline_name", "unknown_pipeline")
+    return values
+
 
 class EngineeringStoreInputStrategy(ABC):
     @abstractmethod
@@ -17,37 +70,8 @@ class HopsflowBRZInputStrategy(EngineeringStoreInputStrategy):
     """
 
     def build(self, schema: Dict, metadata: Dict) -> str:
-        zone = schema.get("zone", "maz")
-        landing_zone = schema.get("landing_zone", zone)
-        country = schema.get("country", "")
-        domain = schema.get("domain", "unknown")
-        pipeline = metadata.get("pipeline_name", "unknown_pipeline")
-        schedule = schema.get("schedule", "* * * * *")
-        table_name = schema.get("table_name", "raw_table")
-        owner = schema.get("owner", "platform")
-        connector = schema.get("connector", "blob")
-        source_system = schema.get("source_system", "sap")
-        source_entity = schema.get("source_entity", "sap")
-        target_entity = schema.get("target_entity", "sap")
-        connection_id = schema.get("connection_id", "sap-secret")
-        acl = schema.get("acl", "n")
-
-        return f"""\
-{zone}
-{landing_zone}
-{country}
-{domain}
-{pipeline}
-{schedule}
-{table_name}
-{owner}
-{connector}
-{source_system}
-{source_entity}
-{target_entity}
-{connection_id}
-n{acl}
-"""
+        values = _prompt_values(schema, metadata, _HOPSFLOW_DEFAULTS)
+        return _BRZ_PROMPT_TEMPLATE.format_map(values)
 
 
 class HopsflowSLVInputStrategy(EngineeringStoreInputStrategy):
@@ -57,38 +81,8 @@ class HopsflowSLVInputStrategy(EngineeringStoreInputStrategy):
     """
 
     def build(self, schema: Dict, metadata: Dict) -> str:
-        zone = schema.get("zone", "maz")
-        landing_zone = schema.get("landing_zone", zone)
-        country = schema.get("country", "")
-        domain = schema.get("domain", "unknown")
-        pipeline = metadata.get("pipeline_name", "unknown_pipeline")
-        schedule = schema.get("schedule", "* * * * *")
-        table_name = schema.get("table_name", "raw_table")
-        owner = schema.get("owner", "platform")
-        connector = schema.get("connector", "blob")
-        source_system = schema.get("source_system", "sap")
-        source_entity = schema.get("source_entity", "sap")
-        target_entity = schema.get("target_entity", "sap")
-        connection_id = schema.get("connection_id", "sap-secret")
-        transformations = schema.get("transformations", "y")
-        acl = schema.get("acl", "n")
-
-        return f"""\
-{zone}
-{landing_zone}
-{country}
-{domain}
-{pipeline}
-{schedule}
-{table_name}
-{owner}
-{connector}
-{source_system}
-{source_entity}
-{target_entity}
-{connection_id}
-{transformations}{acl}
-"""
+        values = _prompt_values(schema, metadata, _HOPSFLOW_DEFAULTS)
+        return _SLV_PROMPT_TEMPLATE.format_map(values)
 
 
 class BrewtifulGLDInputStrategy(EngineeringStoreInputStrategy):
@@ -98,43 +92,22 @@ class BrewtifulGLDInputStrategy(EngineeringStoreInputStrategy):
     """
 
     def build(self, schema: Dict, metadata: Dict) -> str:
-        zone = schema.get("zone", "maz")
-        landing_zone = schema.get("landing_zone", zone)
-        country = schema.get("country", "mz")
-        domain = schema.get("domain", "unknown")
-        pipeline = metadata.get("pipeline_name", "unknown_pipeline")
-        schedule = schema.get("schedule", "* * * * *")
-        table_name = schema.get("table_name", "feature_table")
-        owner = schema.get("owner", "platform")
-        table_scope = schema.get("table_scope", "transformation")
-        data_product_subdomain = schema.get("data_product_subdomain", "default")
-        acl = schema.get("acl", "n")
-        trigger = schema.get("trigger", "n")
-
-        return f"""\
-{zone}
-{landing_zone}
-{country}
-{domain}
-{pipeline}
-{schedule}
-{table_name}
-{owner}
-{table_scope}
-
-{data_product_subdomain}
-{acl}{trigger}
-"""
+        values = _prompt_values(schema, metadata, _BREWTIFUL_DEFAULTS)
+        return _GLD_PROMPT_TEMPLATE.format_map(values)
+
+
+# Strategies are stateless, so one shared instance per environment is enough.
+_STRATEGIES: Dict[str, EngineeringStoreInputStrategy] = {
+    "brz": HopsflowBRZInputStrategy(),
+    "slv": HopsflowSLVInputStrategy(),
+}
+_DEFAULT_STRATEGY = BrewtifulGLDInputStrategy()
 
 
 class EngineeringStoreInputBuilderFactory:
     @staticmethod
     def get(environment: str) -> EngineeringStoreInputStrategy:
-        if environment == "brz":
-            return HopsflowBRZInputStrategy()
-        if environment == "slv":
-            return HopsflowSLVInputStrategy()
-        return BrewtifulGLDInputStrategy()
+        return _STRATEGIES.get(environment, _DEFAULT_STRATEGY)
 
 
 def build_engineeringstore_inputs(schema: Dict, metadata: Dict, environment: str) -> str:
@@ -0,0 +1 @@
+"""Domain services for framework repository preparation and manifest checks."""
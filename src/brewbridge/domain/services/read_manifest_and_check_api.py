@@ -10,18 +10,51 @@ The LangGraph ToolNode wrapper lives in
 """
 
 import os
+import random
 import time
 from typing import Dict, Optional
 
 from langchain_openai import ChatOpenAI
 
-from brewbridge.infrastructure.datafactory_client import ADFClient
-from brewbridge.infrastructure.databricks_client import DatabricksClient
-from brewbridge.infrastructure.github_client import GitHubClient
+from brewbridge.infrastructure.datafactory_client import get_adf_client
+from brewbridge.infrastructure.databricks_client import get_databricks_client
+from brewbridge.infrastructure.github_client import get_github_client
+from brewbridge.infrastructure.http_session import build_session
 from brewbridge.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Environment variables collected as credentials, grouped by the API they unlock.
+_CREDENTIAL_ENV_KEYS = (
+    "GITHUB_TOKEN",
+    "ADF_TENANT_ID",
+    "ADF_CLIENT_ID",
+    "ADF_CLIENT_SECRET",
+    "ASIMOV_URL",
+    "ASIMOV_PRODUCT_TOKEN",
+    "OPENAI_API_KEY",
+    "DATABRICKS_HOST",
+    "DATABRICKS_TOKEN",
+    "DATABRICKS_WAREHOUSE_ID",
+)
+
+# Backoff between manual ping retries: 0.2s, 0.4s, 0.8s, ... plus jitter, capped.
+_BACKOFF_BASE_SECONDS = 0.2
+_BACKOFF_MAX_SECONDS = 2.0
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based retry attempt."""
+    # Non-cryptographic jitter; only spreads retries apart.
+    delay = _BACKOFF_BASE_SECONDS * (2**attempt) + random.random() * 0.1  # noqa: S311
+    return min(delay, _BACKOFF_MAX_SECONDS)
+
+
+# Pooled session for LLM provider pings; reused across preflight runs.
+_SESSION = build_session(pool_connections=4, pool_maxsize=10)
+
+_OPENAI_MODELS_URL = "https://api.openai.com/v1/models"
+
 
 class ManifestPreflightService:
     """Service responsible for manifest-related pre-flight checks."""
@@ -67,45 +100,13 @@ class ManifestPreflightService:
 
         Returns a dictionary of credentials from the environment.
         """
-        creds: Dict[str, str] = {}
-
-        # GitHub credentials
-        if github_token := os.getenv("GITHUB_TOKEN"):
-            creds["GITHUB_TOKEN"] = github_token
-
-        # Azure Data Factory credentials
-        if tenant_id := os.getenv("ADF_TENANT_ID"):
-            creds["ADF_TENANT_ID"] = tenant_id
-        if client_id := os.getenv("ADF_CLIENT_ID"):
-            creds["ADF_CLIENT_ID"] = client_id
-        if client_secret := os.getenv("ADF_CLIENT_SECRET"):
-            creds["ADF_CLIENT_SECRET"] = client_secret
-
-        # LLM API credentials (Asimov)
-        if asimov_url := os.getenv("ASIMOV_URL"):
-            creds["ASIMOV_URL"] = asimov_url
-        if asimov_token := os.getenv("ASIMOV_PRODUCT_TOKEN"):
-            creds["ASIMOV_PRODUCT_TOKEN"] = asimov_token
-
-        # OpenAI (if used directly)
-        if openai_key := os.getenv("OPENAI_API_KEY"):
-            creds["OPENAI_API_KEY"] = openai_key
-
-        # Databricks credentials
-        if databricks_host := os.getenv("DATABRICKS_HOST"):
-            creds["DATABRICKS_HOST"] = databricks_host
-        if databricks_token := os.getenv("DATABRICKS_TOKEN"):
-            creds["DATABRICKS_TOKEN"] = databricks_token
-        if databricks_wh := os.getenv("DATABRICKS_WAREHOUSE_ID"):
-            creds["DATABRICKS_WAREHOUSE_ID"] = databricks_wh
-
-        return creds
+        return {key: value for key in _CREDENTIAL_ENV_KEYS if (value := os.environ.get(key))}
 
     def ping_github(self, credentials: Dict[str, str]) -> bool:
         """
         Ping GitHub API to verify connectivity and token validity.
 
-        Retries up to 3 times on failure.
+        Transient HTTP failures are retried with backoff by the client's session.
         """
         github_token = credentials.get("GITHUB_TOKEN")
         if not github_token:
@@ -114,22 +115,12 @@ class ManifestPreflightService:
             )
             return False
 
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                client = GitHubClient(token=github_token)
-                if client.ping():
-                    return True
-            except Exception as exc:  # pragma: no cover - defensive logging
-                self._logger.warning(
-                    "GitHub ping attempt %s/%s failed: %s",
-                    attempt + 1,
-                    max_retries,
-                    exc,
-                )
-
-            if attempt < max_retries - 1:
-                time.sleep(1)  # Wait 1 second before retry
+        try:
+            client = get_github_client(github_token)
+            if client.ping():
+                return True
+        except Exception as exc:  # pragma: no cover - defensive logging
+            self._logger.warning("GitHub ping failed: %s", exc)
 
         self._logger.error("GitHub ping failed after all retries.")
         return False
@@ -138,7 +129,7 @@ class ManifestPreflightService:
         """
         Ping Azure Data Factory API to verify connectivity.
 
-        Retries up to 3 times on failure.
+        Transient HTTP failures are retried with backoff by the client's session.
         """
         tenant_id = credentials.get("ADF_TENANT_ID")
         client_id = credentials.get("ADF_CLIENT_ID")
@@ -150,26 +141,16 @@ class ManifestPreflightService:
             )
             return False
 
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                client = ADFClient(
-                    tenant_id=tenant_id,
-                    client_id=client_id,
-                    client_secret=client_secret,
-                )
-                if client.ping():
-                    return True
-            except Exception as exc:  # pragma: no cover - defensive logging
-                self._logger.warning(
-                    "ADF ping attempt %s/%s failed: %s",
-                    attempt + 1,
-                    max_retries,
-                    exc,
-                )
-
-            if attempt < max_retries - 1:
-                time.sleep(1)  # Wait 1 second before retry
+        try:
+            client = get_adf_client(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                client_secret=client_secret,
+            )
+            if client.ping():
+                return True
+        except Exception as exc:  # pragma: no cover - defensive logging
+            self._logger.warning("ADF ping failed: %s", exc)
 
         self._logger.error("Azure Data Factory ping failed after all retries.")
         return False
@@ -193,7 +174,7 @@ class ManifestPreflightService:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                client = DatabricksClient()
+                client = get_databricks_client()
                 if client.ping():
                     self._logger.info("Databricks ping successful.")
                     return True
@@ -206,7 +187,7 @@ class ManifestPreflightService:
                 )
 
             if attempt < max_retries - 1:
-                time.sleep(1)
+                time.sleep(_backoff_delay(attempt))
 
         self._logger.error("Databricks ping failed after all retries.")
         return False
@@ -239,13 +220,17 @@ class ManifestPreflightService:
         openai_key = credentials.get("OPENAI_API_KEY")
         if openai_key:
             try:
-                import requests
-
-                response = requests.get(
-                    "https://api.openai.com/v1/models",
-                    headers={"Authorization": f"Bearer {openai_key}"},
-                    timeout=5,
+                headers = {"Authorization": f"Bearer {openai_key}"}
+                # HEAD proves reachability and auth without downloading the model list.
+                response = _SESSION.head(
+                    _OPENAI_MODELS_URL, headers=headers, timeout=5, allow_redirects=False
                 )
+                if response.status_code == 405:
+                    # HEAD not allowed: stream a GET and close it without reading the body.
+                    with _SESSION.get(
+                        _OPENAI_MODELS_URL, headers=headers, timeout=5, stream=True
+                    ) as response:
+                        pass
                 if response.status_code == 200:
                     self._logger.info("OpenAI API ping successful.")
                     return True
@@ -5,11 +5,17 @@ This module contains the logic to detect required frameworks from the manifest
 and to clone or update the corresponding repositories.
 """
 
+import logging
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Sequence, Set
-
-from git import Repo
-from git.exc import GitCommandError, GitError
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
 
 from brewbridge.infrastructure.logger import get_logger
 from brewbridge.utils.constans import ConstansLibrary
@@ -17,14 +23,120 @@ from brewbridge.utils.exceptions import RepositoryCloneError
 
 logger = get_logger(__name__)
 
+# Repositories already prepared in this process; repeat status messages drop to DEBUG.
+_PREPARED_REPOS: Set[str] = set()
+
+# Local checkout root for the framework repositories.
+_CACHE_DIR = Path("cache")
+
+# Directories renamed aside and already handed to a background delete.
+_DISCARDED_DIRS: Set[Path] = set()
+
+# Remote HEAD sha per repository with its ls-remote time (time.monotonic()).
+_REMOTE_HEADS: Dict[str, Tuple[str, float]] = {}
+# Reuse a remote HEAD only briefly so a long-lived process still picks up new commits.
+_REMOTE_HEAD_TTL_SECONDS = 60.0
+
+BREWTIFUL_REPO = "brewtiful"
+HOPSFLOW_REPO = "brewdat-pltfrm-ghq-tech-hopsflow"
+ALL_FRAMEWORK_REPOS = frozenset({BREWTIFUL_REPO, HOPSFLOW_REPO})
+
+# Framework repos are read-only caches: only the tip of the default branch is needed.
+_SHALLOW_CLONE_OPTIONS = ["--depth=1", "--single-branch", "--no-tags"]
+
+# Abort transfers that stay below 1 KB/s for a minute instead of hanging the graph.
+_GIT_STALL_ENV = {"GIT_HTTP_LOW_SPEED_LIMIT": "1000", "GIT_HTTP_LOW_SPEED_TIME": "60"}
+
+# Absolute path of the git binary, resolved once; None when git is not installed.
+_GIT_EXECUTABLE = shutil.which("git")
+
+
+def _run_git(*args: str) -> str:
+    """
+    Run a git command and return its stdout.
+
+    Calling the git binary directly avoids GitPython's import cost and the
+    object graph it builds for every `Repo(...)`.
+
+    :raises subprocess.CalledProcessError: If git exits with a non-zero code.
+    :raises FileNotFoundError: If git is not installed.
+    """
+    if _GIT_EXECUTABLE is None:
+        raise FileNotFoundError("git executable not found in PATH")
+    # Arguments are fixed git subcommands plus repo URLs/paths from this module; no shell.
+    result = subprocess.run(  # noqa: S603
+        [_GIT_EXECUTABLE, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **_GIT_STALL_ENV},
+    )
+    return result.stdout
+
+
+def _unlock_and_retry(func: Callable[[str], Any], path: str, _exc: Any) -> None:
+    """`shutil.rmtree` error handler: clear the read-only bit and retry once."""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _rmtree(path: Path) -> None:
+    """`shutil.rmtree` with `_unlock_and_retry`; `onerror` is deprecated from 3.12."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_unlock_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_unlock_and_retry)
+
+
+def _remove_tree_quietly(path: Path) -> None:
+    """Delete a directory tree, leaving anything undeletable for the next purge."""
+    try:
+        _rmtree(path)
+    except OSError as err:
+        logger.debug("Could not fully remove %s: %s", path, err)
+
+
+def _delete_in_background(path: Path) -> None:
+    _DISCARDED_DIRS.add(path)
+    threading.Thread(
+        target=_remove_tree_quietly, args=(path,), name="cache-cleanup", daemon=True
+    ).start()
+
+
+def _discard_directory(path: Path) -> None:
+    """
+    Free `path` immediately and delete its old contents off the critical path.
+
+    Renaming is a single directory-entry operation, while `rmtree` unlinks
+    every file; the rename lets the clone start at once. If the rename fails
+    (e.g. a file is held open on Windows), fall back to deleting in place.
+    """
+    dead = path.with_name(f"{path.name}.dead.{os.getpid()}.{int(time.time())}")
+    try:
+        path.rename(dead)
+    except OSError:
+        # Git marks pack files read-only, which breaks plain rmtree on Windows.
+        _rmtree(path)
+        return
+    _delete_in_background(dead)
+
+
+def _purge_dead_directories(cache_dir: Path) -> None:
+    """Schedule deletion of `*.dead.*` leftovers from earlier runs."""
+    if not cache_dir.is_dir():
+        return
+    for leftover in cache_dir.glob("*.dead.*"):
+        if leftover.is_dir() and leftover not in _DISCARDED_DIRS:
+            _delete_in_background(leftover)
+
 
 class RepoClonerService:
     """Service responsible for preparing framework repositories."""
 
     def _get_repo_url(self, repo_name: str) -> str:
         repo_urls = {
-            "brewtiful": ConstansLibrary.BREWTIFUL_REPO_URL,
-            "brewdat-pltfrm-ghq-tech-hopsflow": ConstansLibrary.HOPSFLOW_REPO_URL,
+            BREWTIFUL_REPO: ConstansLibrary.BREWTIFUL_REPO_URL,
+            HOPSFLOW_REPO: ConstansLibrary.HOPSFLOW_REPO_URL,
         }
 
         if repo_name not in repo_urls:
@@ -32,6 +144,45 @@ class RepoClonerService:
 
         return repo_urls[repo_name]
 
+    def _detect_required_frameworks(self, pipeline_names: Sequence[str]) -> Set[str]:
+        """
+        Map pipeline names to the framework repositories they need.
+
+        - "gld" → brewtiful (Gold framework)
+        - "brz" or "slv" → hopsflow (Bronze/Silver framework)
+        """
+        required: Set[str] = set()
+        for name in pipeline_names:
+            name = name.lower()
+            if "gld" in name:
+                required.add(BREWTIFUL_REPO)
+            if "brz" in name or "slv" in name:
+                required.add(HOPSFLOW_REPO)
+            if len(required) == len(ALL_FRAMEWORK_REPOS):
+                break
+        return required
+
+    def _is_up_to_date(self, repo_name: str, destination: Path) -> bool:
+        """
+        Compare the local HEAD with the remote HEAD without fetching any objects.
+
+        `git ls-remote` costs a single round trip; its result is reused for
+        `_REMOTE_HEAD_TTL_SECONDS` so back-to-back calls stay local.
+        """
+        now = time.monotonic()
+        cached = _REMOTE_HEADS.get(repo_name)
+        if cached is not None and now - cached[1] < _REMOTE_HEAD_TTL_SECONDS:
+            remote_sha = cached[0]
+        else:
+            output = _run_git("-C", str(destination), "ls-remote", "origin", "HEAD").split()
+            if not output:
+                return False
+            remote_sha = output[0]
+            _REMOTE_HEADS[repo_name] = (remote_sha, now)
+
+        local_sha = _run_git("-C", str(destination), "rev-parse", "HEAD").strip()
+        return local_sha == remote_sha
+
     def _clone_or_pull_repo(self, repo_name: str, destination: Path, github_token: str) -> None:
         repo_url = self._get_repo_url(repo_name)
 
@@ -42,71 +193,57 @@ class RepoClonerService:
             else repo_url
         )
 
-        shallow_depth = 10  # reduce bandwidth/time when cloning
-
         try:
-            if destination.exists() and (destination / ".git").exists():
+            # A .git entry implies the destination exists, so one stat covers both checks.
+            if (destination / ".git").exists():
                 logger.info(
-                    "Repository %s already exists at %s, pulling updates...",
+                    "Repository %s already exists at %s, updating to the remote tip...",
                     repo_name,
                     destination,
                 )
+                # Unlink directly instead of exists()-then-unlink: one syscall, no race window.
                 lock_file = destination / ".git" / "index.lock"
-                if lock_file.exists():
-                    logger.warning("Found stale git lock file, attempting to remove it...")
-                    try:
-                        lock_file.unlink()
-                    except (PermissionError, OSError) as err:
-                        logger.warning(
-                            "Could not remove lock file (may be in use by another process): %s",
-                            err,
-                        )
-                        logger.warning("Will attempt to proceed anyway...")
-                        import time
-
-                        time.sleep(1)
-
-                repo = Repo(destination)
-
-                if repo.is_dirty():
-                    logger.info("Repository has local changes, resetting to match remote...")
-                    repo.head.reset(working_tree=True)
-
-                origin = repo.remotes.origin
-                origin.fetch()
                 try:
-                    origin.pull()
-                except GitCommandError as pull_error:
-                    if "would be overwritten" in str(pull_error) or "local changes" in str(
-                        pull_error
-                    ):
-                        logger.warning(
-                            "Pull failed due to local changes, resetting to remote state...",
-                        )
-                        repo.head.reset(working_tree=True, index=True)
-                        origin.pull()
-                    else:
-                        raise
+                    lock_file.unlink()
+                    logger.warning("Removed stale git lock file %s", lock_file)
+                except FileNotFoundError:
+                    pass
+                except OSError as err:
+                    logger.warning(
+                        "Could not remove lock file (may be in use by another process): %s",
+                        err,
+                    )
+                    logger.warning("Will attempt to proceed anyway...")
+                    time.sleep(1)
+
+                if self._is_up_to_date(repo_name, destination):
+                    # The CLI writes into this checkout; drop its edits to tracked files
+                    # even when there is nothing new to fetch.
+                    status = _run_git(
+                        "-C", str(destination), "status", "--porcelain", "--untracked-files=no"
+                    )
+                    if status.strip():
+                        _run_git("-C", str(destination), "reset", "--hard", "HEAD")
+                    logger.info("Repository %s cache up to date, skipping fetch", repo_name)
+                    return
+
+                # The cache only needs the remote tip: fetch it shallowly and force the
+                # working tree to match. Local changes are discarded, so no pull/merge.
+                _run_git("-C", str(destination), "fetch", "--depth=1", "origin")
+                _run_git("-C", str(destination), "reset", "--hard", "origin/HEAD")
 
                 logger.info("Successfully updated repository %s", repo_name)
-            elif destination.exists() and not (destination / ".git").exists():
+            elif destination.exists():
                 logger.info(
                     "Directory %s exists but is not a git repository. Removing and cloning fresh...",
                     destination,
                 )
-                import shutil
-
-                shutil.rmtree(destination)
-                destination.parent.mkdir(parents=True, exist_ok=True)
+                _discard_directory(destination)
                 logger.info(
                     "Cloning repository %s (this may take several minutes for large repositories)...",
                     repo_name,
                 )
-                Repo.clone_from(
-                    authenticated_url,
-                    str(destination),
-                    depth=shallow_depth,
-                )
+                _run_git("clone", *_SHALLOW_CLONE_OPTIONS, authenticated_url, str(destination))
                 logger.info("Successfully cloned repository %s", repo_name)
             else:
                 logger.info(
@@ -115,19 +252,19 @@ class RepoClonerService:
                     destination,
                 )
                 destination.parent.mkdir(parents=True, exist_ok=True)
-                Repo.clone_from(
-                    authenticated_url,
-                    str(destination),
-                    depth=shallow_depth,
-                )
+                _run_git("clone", *_SHALLOW_CLONE_OPTIONS, authenticated_url, str(destination))
                 logger.info("Successfully cloned repository %s", repo_name)
 
-        except GitCommandError as err:
-            error_msg = f"Git command failed for {repo_name}: {err}"
+        except subprocess.CalledProcessError as err:
+            # err.cmd holds the authenticated URL; report only git's own stderr.
+            stderr = (err.stderr or "").strip()
+            if github_token:
+                stderr = stderr.replace(github_token, "***")
+            error_msg = f"Git command failed for {repo_name} (exit {err.returncode}): {stderr}"
             logger.error(error_msg)
-            raise RepositoryCloneError(error_msg) from err
-        except GitError as err:
-            error_msg = f"Git error for {repo_name}: {err}"
+            raise RepositoryCloneError(error_msg) from None
+        except FileNotFoundError as err:
+            error_msg = f"Git error for {repo_name}: git executable not found ({err})"
             logger.error(error_msg)
             raise RepositoryCloneError(error_msg) from err
         except Exception as err:  # pragma: no cover - defensive logging
@@ -135,22 +272,49 @@ class RepoClonerService:
             logger.error(error_msg)
             raise RepositoryCloneError(error_msg) from err
 
-    def prepare_repositories(self, github_token: str) -> List[str]:
+    def prepare_repositories(
+        self, github_token: str, pipeline_names: Sequence[str] = ()
+    ) -> List[str]:
         """
-        Clone or update both framework repositories (brewtiful and hopsflow).
+        Clone or update the framework repositories required by the pipelines.
+
+        When no framework can be inferred from `pipeline_names`, both
+        repositories (brewtiful and hopsflow) are prepared.
 
         :param github_token: GitHub token for authentication.
+        :param pipeline_names: Pipeline/trigger names or environment types to inspect.
         :return: List of framework names that were cloned/updated.
         """
-        repos_to_clone: Set[str] = {"brewtiful", "brewdat-pltfrm-ghq-tech-hopsflow"}
-        logger.info("Cloning frameworks: %s", list(repos_to_clone))
+        repos_to_clone = self._detect_required_frameworks(pipeline_names) or set(
+            ALL_FRAMEWORK_REPOS
+        )
+        _purge_dead_directories(_CACHE_DIR)
+        status_level = logging.DEBUG if repos_to_clone <= _PREPARED_REPOS else logging.INFO
+        logger.log(status_level, "Cloning frameworks: %s", sorted(repos_to_clone))
 
         cloned_repos = []
-        for repo_name in sorted(repos_to_clone):
-            repo_path = Path(f"cache/{repo_name}")
-            self._clone_or_pull_repo(repo_name, repo_path, github_token)
-            cloned_repos.append(repo_name)
-            logger.info("Repository %s is ready at %s", repo_name, repo_path)
+        # Each repo is independent network + disk I/O in its own git subprocess,
+        # so threads are enough to overlap them.
+        with ThreadPoolExecutor(max_workers=len(repos_to_clone)) as executor:
+            futures = {
+                executor.submit(
+                    self._clone_or_pull_repo, repo_name, _CACHE_DIR / repo_name, github_token
+                ): repo_name
+                for repo_name in sorted(repos_to_clone)
+            }
+            for future in as_completed(futures):
+                repo_name = futures[future]
+                future.result()
+                cloned_repos.append(repo_name)
+                logger.log(
+                    logging.DEBUG if repo_name in _PREPARED_REPOS else logging.INFO,
+                    "Repository %s is ready at %s",
+                    repo_name,
+                    _CACHE_DIR / repo_name,
+                )
+                _PREPARED_REPOS.add(repo_name)
+
+        cloned_repos.sort()
 
         logger.info("Framework repository setup completed. Cloned/updated: %s", cloned_repos)
         return cloned_repos
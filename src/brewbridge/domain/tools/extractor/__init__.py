@@ -0,0 +1 @@
+"""Pipeline extractor tools, grouped by framework version."""
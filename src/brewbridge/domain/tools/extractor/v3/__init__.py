@@ -0,0 +1 @@
+"""Extractor tool for BrewDat 3.0 pipelines."""
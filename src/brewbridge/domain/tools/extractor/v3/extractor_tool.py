@@ -12,7 +12,7 @@ from typing import Any, Dict
 from brewbridge.core.base_nodes import tool_node
 from brewbridge.core.state import MigrationGraphState
 from brewbridge.domain.extractor_strategies.brewdat.brewdat_3_0_strategy import Brewdat3Strategy
-from brewbridge.infrastructure import GitHubClient, get_logger
+from brewbridge.infrastructure import get_github_client, get_logger
 from brewbridge.infrastructure.observability.mlflow_tracer import track_node
 from brewbridge.utils.exceptions import ExtractionError, InvalidInputError
 
@@ -26,6 +26,10 @@ def extractor_node(state: MigrationGraphState) -> MigrationGraphState:
     Ejecuta la estrategia de extracción para la plataforma 3.0 y
     actualiza el estado con los artefactos crudos obtenidos.
     """
+    github_token = (state.credentials or {}).get("GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN")
+    if not github_token:
+        raise ExtractionError("GITHUB_TOKEN no encontrado en credenciales ni en el entorno.")
+
     pipeline_data: Dict[str, Any] = state.pipeline_info or {}
     repo_name = pipeline_data.get("repo_name")
     trigger_name = pipeline_data.get("trigger_name")
@@ -36,14 +40,9 @@ def extractor_node(state: MigrationGraphState) -> MigrationGraphState:
             "No hay 'repo_name' o 'trigger_name' en pipeline_info para iniciar la extracción."
         )
 
-    logger.info(f"🔧 ExtractorTool activado. Estrategia seleccionada: {source_platform}")
-
-    creds = state.credentials or {}
-    github_token = creds.get("GITHUB_TOKEN") or os.getenv("GITHUB_TOKEN")
-    if not github_token:
-        raise ExtractionError("GITHUB_TOKEN no encontrado en credenciales ni en el entorno.")
+    logger.info("🔧 ExtractorTool activado. Estrategia seleccionada: %s", source_platform)
 
-    client = GitHubClient(token=github_token)
+    client = get_github_client(github_token)
     if source_platform == "platform_3_0":
         strategy = Brewdat3Strategy(github_client=client)
 
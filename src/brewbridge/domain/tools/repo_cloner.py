@@ -4,8 +4,8 @@ Repo_Cloner_Tool - Unified Framework Preparation Tool
 This tool prepares the migration environment by cloning or updating the
 destination frameworks repositories (brewtiful and/or hopsflow) from GitHub.
 
-It analyzes the list of pipelines from the manifest (pipelines_to_migrate) and
-determines which frameworks are required based on pipeline naming patterns:
+It analyzes the environment type and pipeline/trigger names from the state and
+determines which frameworks are required based on naming patterns:
 - "gld" → Brewtiful (Gold framework)
 - "brz" or "slv" → Hopsflow (Bronze/Silver framework)
 """
@@ -26,12 +26,12 @@ def repo_cloner(state: MigrationGraphState) -> MigrationGraphState:
     """
     Clone or update required 4.0 framework repositories.
 
-    This tool analyzes pipelines_to_migrate to determine which frameworks
+    This tool analyzes the current pipeline to determine which frameworks
     (brewtiful, hopsflow) are needed and ensures they are locally available
     under cache/ directory.
 
     Expected state input:
-    - state.pipelines_to_migrate: List of pipelines from manifest
+    - state.environment_type / state.pipeline_info: used to infer the frameworks
     - state.credentials: Dictionary containing GITHUB_TOKEN
 
     Updates state with:
@@ -43,8 +43,19 @@ def repo_cloner(state: MigrationGraphState) -> MigrationGraphState:
     if not github_token:
         raise RepositoryCloneError("GITHUB_TOKEN not found in credentials")
 
+    pipeline_info = state.pipeline_info or {}
+    pipeline_names = [
+        name
+        for name in (
+            state.environment_type,
+            pipeline_info.get("trigger_name"),
+            pipeline_info.get("pipeline_name"),
+        )
+        if name
+    ]
+
     service = RepoClonerService()
-    cloned_repos = service.prepare_repositories(github_token)
+    cloned_repos = service.prepare_repositories(github_token, pipeline_names)
 
     state.repos_cloned = cloned_repos
     return state
@@ -6,16 +6,60 @@ pre-flight API connectivity checks using the domain-level
 `ManifestPreflightService`.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict
+
 from brewbridge.core.base_nodes import tool_node
 from brewbridge.core.state import MigrationGraphState
 from brewbridge.domain.services.read_manifest_and_check_api import ManifestPreflightService
 from brewbridge.infrastructure.logger import get_logger
 from brewbridge.infrastructure.observability import track_node
-from brewbridge.utils.exceptions import ManifestNotFoundError, ManifestParseError
-from brewbridge.utils.manifest_yaml_utils import load_manifest
+from brewbridge.utils.exceptions import ManifestNotFoundError
 
 logger = get_logger(__name__)
 
+# Upper bound for the whole preflight fan-out: the slowest probe (Databricks) may
+# retry three times against a warehouse that is still starting.
+_PREFLIGHT_TIMEOUT_SECONDS = 180.0
+
+
+def _run_pings_concurrently(
+    pings: Dict[str, Callable[[Dict[str, str]], bool]], credentials: Dict[str, str]
+) -> Dict[str, bool]:
+    """
+    Run the independent connectivity probes in parallel.
+
+    Total latency is that of the slowest probe instead of the sum of all of
+    them. A probe that raises or does not finish in time counts as failed.
+    """
+    results: Dict[str, bool] = {}
+    if not pings:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(pings), thread_name_prefix="preflight")
+    futures = {executor.submit(ping, credentials): name for name, ping in pings.items()}
+    try:
+        for future in as_completed(futures, timeout=_PREFLIGHT_TIMEOUT_SECONDS):
+            name = futures[future]
+            try:
+                results[name] = bool(future.result())
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.warning("%s connectivity check raised: %s", name, exc)
+                results[name] = False
+    except FuturesTimeoutError:
+        for future, name in futures.items():
+            if name not in results:
+                logger.warning(
+                    "%s connectivity check timed out after %ss.", name, _PREFLIGHT_TIMEOUT_SECONDS
+                )
+                results[name] = False
+    finally:
+        # Do not block the graph on a probe that is still hanging.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
 
 @track_node("tool")
 @tool_node
@@ -62,47 +106,46 @@ def read_manifest_and_check_api(
     )
 
     # Log warnings for missing expected credentials
-    expected_creds = ["GITHUB_TOKEN"]
-    missing_creds = [cred for cred in expected_creds if cred not in credentials]
-    if missing_creds:
-        logger.warning(
-            "Missing expected credentials: %s",
-            ", ".join(missing_creds),
-        )
+    if not github_env_present:
+        logger.warning("Missing expected credentials: %s", "GITHUB_TOKEN")
 
     # Step 3: Validate connectivity
-    if github_env_present:
-        github_ok = service.ping_github(credentials)
-    else:
+    if not github_env_present:
         logger.info("Skipping GitHub connectivity check; GITHUB_TOKEN env var not set.")
-        github_ok = False
-
-    if adf_env_present:
-        adf_ok = service.ping_adf(credentials)
-    else:
+    if not adf_env_present:
         logger.info("Skipping Azure Data Factory connectivity check; no ADF env vars provided.")
-        adf_ok = True
-
-    if databricks_env_present:
-        databricks_ok = service.ping_databricks(credentials)
-    else:
+    if not databricks_env_present:
         logger.info("Skipping Databricks connectivity check; no Databricks env vars provided.")
-        databricks_ok = True
-
-    if llm_env_present:
-        llm_ok = service.ping_llm_apis(credentials)
-    else:
+    if not llm_env_present:
         logger.info("Skipping LLM connectivity check; no LLM env vars provided.")
-        llm_ok = True
+
+    results = _run_pings_concurrently(
+        {
+            name: ping
+            for name, ping, present in (
+                ("github", service.ping_github, github_env_present),
+                ("adf", service.ping_adf, adf_env_present),
+                ("databricks", service.ping_databricks, databricks_env_present),
+                ("llm", service.ping_llm_apis, llm_env_present),
+            )
+            if present
+        },
+        credentials,
+    )
+    # Skipped GitHub check counts as a failure; the optional APIs default to OK.
+    github_ok = results.get("github", False)
+    adf_ok = results.get("adf", True)
+    databricks_ok = results.get("databricks", True)
+    llm_ok = results.get("llm", True)
 
     # api_connectivity_ok is True only if all required APIs are accessible.
     # GitHub is required; ADF, Databricks and LLM are optional but should
     # be checked if credentials exist.
     api_connectivity_ok = (
         github_ok
-        and (adf_ok or "ADF_TENANT_ID" not in credentials)
+        and (adf_ok or not adf_env_present)
         and (databricks_ok or not databricks_env_present)
-        and (llm_ok or not any(key in credentials for key in ["ASIMOV_URL", "OPENAI_API_KEY"]))
+        and (llm_ok or not llm_env_present)
     )
 
     if not api_connectivity_ok:
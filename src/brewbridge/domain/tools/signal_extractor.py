@@ -6,8 +6,13 @@ produces a compact signal summary using BrewdatSignalExtractor. The
 summary is stored in state.signal_summary for downstream LLM agents.
 """
 
+import copy
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict
 
+import orjson
+
 from brewbridge.core.base_nodes import tool_node
 from brewbridge.core.state import MigrationGraphState
 from brewbridge.domain.extractor_strategies.brewdat.signal_extractor_pipeline import (
@@ -18,6 +23,19 @@ from brewbridge.infrastructure.observability.mlflow_tracer import track_node
 
 logger = get_logger(__name__)
 
+# Signal summaries keyed by a digest of the raw_artifacts they came from, so
+# retries over identical artifacts skip the extraction. Bounded LRU.
+_SUMMARY_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_SUMMARY_CACHE_SIZE = 32
+
+
+def _artifacts_digest(raw_artifacts: Dict[str, Any]) -> str:
+    """Stable content hash of raw_artifacts (key order does not matter)."""
+    canonical = orjson.dumps(
+        raw_artifacts, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+    )
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
 
 @track_node("tool")
 @tool_node
@@ -27,7 +45,17 @@ def signal_extractor_node(state: MigrationGraphState) -> MigrationGraphState:
         logger.warning("signal_extractor_node: raw_artifacts is empty; skipping signal extraction.")
         return state
 
-    extractor = BrewdatSignalExtractor()
-    summary = extractor.extract(raw_artifacts)
-    state.signal_summary = summary
+    key = _artifacts_digest(raw_artifacts)
+    summary = _SUMMARY_CACHE.get(key)
+    if summary is None:
+        summary = BrewdatSignalExtractor().extract(raw_artifacts)
+        _SUMMARY_CACHE[key] = summary
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+    else:
+        logger.debug("signal_extractor_node: raw_artifacts unchanged; reusing cached summary.")
+        _SUMMARY_CACHE.move_to_end(key)
+
+    # Hand out a copy so downstream edits to the state never leak into the cache.
+    state.signal_summary = copy.deepcopy(summary)
     return state
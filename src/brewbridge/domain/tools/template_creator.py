@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+from typing import Set
 
 from brewbridge.core.base_nodes import tool_node
 from brewbridge.core.state import MigrationGraphState
@@ -17,6 +19,15 @@ from brewbridge.utils.exceptions import TemplateCreationError
 
 logger = get_logger(__name__)
 
+# Output directories already created in this process.
+_CREATED_DIRS: Set[str] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cli() -> EngineeringStoreCLI:
+    """Share one EngineeringStoreCLI across node invocations."""
+    return EngineeringStoreCLI(logger=logger)
+
 
 @track_node("tool")
 @tool_node
@@ -31,9 +42,11 @@ def template_creator(state: MigrationGraphState) -> MigrationGraphState:
 
         framework = "brewtiful" if env == "gld" else "hopsflow"
         output_dir = os.path.join("cache", framework)
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in _CREATED_DIRS:
+            os.makedirs(output_dir, exist_ok=True)
+            _CREATED_DIRS.add(output_dir)
 
-        cli = EngineeringStoreCLI(logger=logger)
+        cli = _get_cli()
 
         command = (
             ["engineeringstore", "transformation", "--create-template-files"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 import re
 from collections import OrderedDict
+from operator import itemgetter
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 FILE_LINE_RE = re.compile(r"(Yaml File|YAML File|File Name):\s*(.+)")
@@ -9,6 +11,31 @@ BLOCK_START_RE = re.compile(
     r"\[(ERROR_OCCURRED|DAG_VALIDATION_ERROR_TASK_LEVEL|DAG_VALIDATION_ERROR_BASE_LEVEL|CLI_DAG_VALIDATION_FAILED|DAG_VALIDATION_FAILED)\]"
 )
 
+# Block labels mapped to error fields. When several labels feed the same field,
+# the one listed first takes precedence.
+FIELD_KEYS: Dict[str, str] = {
+    "Yaml File": "file_path",
+    "YAML File": "file_path",
+    "File Name": "file_path",
+    "Error Code": "error_code",
+    "Category": "category",
+    "Severity": "severity",
+    "Yaml Key": "yaml_key",
+    "YAML Key": "yaml_key",
+    "Error Message": "message",
+    "Technical Message": "message",
+    "User Message": "message",
+    "Task Name": "task_name",
+}
+
+_EXT_MAP = {".yaml": "yaml", ".yml": "yaml", ".py": "py", ".ipynb": "ipynb"}
+
+# A known label at the start of a line (after tree-drawing characters) or right
+# after a "|" separator in "timestamp | level | [TAG] | Label: value" headers.
+_FIELD_RE = re.compile(
+    r"(?:^|\|)[\s├└│─]*(" + "|".join(re.escape(label) for label in FIELD_KEYS) + r")\s*:\s*(.*)$"
+)
+
 
 def _normalize_file_path(raw_path: str) -> str:
     path = raw_path.strip().strip("`'\"")
@@ -18,14 +45,7 @@ def _normalize_file_path(raw_path: str) -> str:
 
 
 def _deduce_file_type(file_path: str) -> str:
-    lower = file_path.lower()
-    if lower.endswith((".yaml", ".yml")):
-        return "yaml"
-    if lower.endswith(".py"):
-        return "py"
-    if lower.endswith(".ipynb"):
-        return "ipynb"
-    return "unknown"
+    return _EXT_MAP.get(os.path.splitext(file_path)[1].lower(), "unknown")
 
 
 def _extract_file_paths(lines: Iterable[str]) -> List[str]:
@@ -37,23 +57,6 @@ def _extract_file_paths(lines: Iterable[str]) -> List[str]:
     return paths
 
 
-def _extract_field(lines: List[str], patterns: List[str]) -> Optional[str]:
-    for pat in patterns:
-        for line in lines:
-            if pat in line:
-                value = line.rsplit(":", 1)[1].strip()
-                return value or None
-    return None
-
-
-def _parse_message(lines: List[str]) -> Optional[str]:
-    for key in ("Error Message:", "Technical Message:", "User Message:"):
-        for line in lines:
-            if key in line:
-                return line.split(":", 1)[1].strip() or None
-    return None
-
-
 def _default_message_for_tag(tag: str) -> Optional[str]:
     if tag == "DAG_VALIDATION_FAILED":
         return "DAG validation failed"
@@ -65,47 +68,47 @@ def _default_message_for_tag(tag: str) -> Optional[str]:
 def _parse_block(
     tag: str, block_lines: List[str], fallback_file: Optional[str]
 ) -> Tuple[Optional[str], Dict[str, Any]]:
-    file_path = (
-        _extract_field(block_lines, ["Yaml File", "YAML File", "File Name"]) or fallback_file
-    )
+    seen: Dict[str, str] = {}
+    for line in block_lines:
+        # Every label is followed by ":"; skip the regex on lines that cannot match.
+        if ":" not in line:
+            continue
+        match = _FIELD_RE.search(line)
+        if match and match.group(1) not in seen:
+            seen[match.group(1)] = match.group(2).strip()
+
+    fields: Dict[str, Optional[str]] = {}
+    for label, field in FIELD_KEYS.items():
+        if field not in fields and label in seen:
+            fields[field] = seen[label] or None
+
+    file_path = fields.pop("file_path", None) or fallback_file
     if file_path:
         file_path = _normalize_file_path(file_path)
 
-    message = _parse_message(block_lines) or _default_message_for_tag(tag)
-
-    error = {
-        "error_code": _extract_field(block_lines, ["Error Code"]),
-        "category": _extract_field(block_lines, ["Category"]),
-        "severity": _extract_field(block_lines, ["Severity"]),
-        "yaml_key": _extract_field(block_lines, ["Yaml Key", "YAML Key"]),
-        "message": message,
-        "task_name": _extract_field(block_lines, ["Task Name"]),
-        "tag": tag,
-    }
-    return file_path, error
+    if not fields.get("message"):
+        fields["message"] = _default_message_for_tag(tag)
 
+    # Only the fields present in the block are kept; consumers use .get().
+    error: Dict[str, Any] = {"tag": tag}
+    error.update((field, value) for field, value in fields.items() if value is not None)
+    return file_path, error
 
-def _iter_blocks(lines: List[str]) -> Iterable[Tuple[str, List[str]]]:
-    idx = 0
-    while idx < len(lines):
-        line = lines[idx]
-        start_match = BLOCK_START_RE.search(line)
-        if not start_match:
-            idx += 1
-            continue
 
-        tag = start_match.group(1)
-        start = idx
-        idx += 1
-        while idx < len(lines) and not BLOCK_START_RE.search(lines[idx]):
-            idx += 1
-        yield tag, lines[start:idx]
+def _iter_blocks(raw_output: str) -> Iterable[Tuple[str, List[str]]]:
+    matches = list(BLOCK_START_RE.finditer(raw_output))
+    for current, following in zip(matches, matches[1:] + [None]):
+        end = following.start() if following else len(raw_output)
+        yield current.group(1), raw_output[current.end() : end].splitlines()
 
 
 def parse_validation_output(raw_output: str) -> List[Dict[str, Any]]:
     """
     Convert engineeringstore validation stdout/stderr into a structured list grouped by file.
 
+    Error entries always carry "tag"; the other fields are omitted when the
+    block does not report them.
+
     Returns:
         [
           {
@@ -118,7 +121,7 @@ def parse_validation_output(raw_output: str) -> List[Dict[str, Any]]:
                 "severity": "MEDIUM",
                 "yaml_key": "public_dag",
                 "message": "must be of boolean type",
-                "task_name": None,
+                "tag": "ERROR_OCCURRED",
               },
             ],
           },
@@ -127,12 +130,11 @@ def parse_validation_output(raw_output: str) -> List[Dict[str, Any]]:
     if not raw_output:
         return []
 
-    lines = raw_output.splitlines()
     file_map: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
     last_seen_file: Optional[str] = None
 
-    for tag, block in _iter_blocks(lines):
+    for tag, block in _iter_blocks(raw_output):
         block_file, error = _parse_block(tag, block, last_seen_file)
         if block_file:
             last_seen_file = block_file
@@ -143,9 +145,9 @@ def parse_validation_output(raw_output: str) -> List[Dict[str, Any]]:
                     "errors": [],
                 }
             # Only append if there is at least some message or field
-            if any(v is not None for k, v in error.items() if k != "tag"):
+            if len(error) > 1:
                 file_map[block_file]["errors"].append(error)
 
     # Deterministic ordering by file_path
-    ordered = sorted(file_map.values(), key=lambda item: item["file_path"])
+    ordered = sorted(file_map.values(), key=itemgetter("file_path"))
     return ordered
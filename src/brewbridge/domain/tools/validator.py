@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+
 from brewbridge.core.base_nodes import tool_node
 from brewbridge.core.state import MigrationGraphState
 from brewbridge.domain.extractor_strategies.engineeringstore_input_builder import (
@@ -18,6 +20,12 @@ from brewbridge.utils.exceptions import StateValidationError
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_cli() -> EngineeringStoreCLI:
+    """Share one EngineeringStoreCLI across node invocations."""
+    return EngineeringStoreCLI(logger=logger)
+
+
 @track_node("tool")
 @tool_node
 def validator(state: MigrationGraphState) -> MigrationGraphState:
@@ -41,7 +49,7 @@ def validator(state: MigrationGraphState) -> MigrationGraphState:
     es_command = EngineeringStoreCommand(
         command=cmd_args, table_type="gold" if env == "gld" else env, needs_input=False
     )
-    cli = EngineeringStoreCLI(logger=logger)
+    cli = _get_cli()
 
     result = cli.run_with_result(es_command, raise_on_error=False)
 
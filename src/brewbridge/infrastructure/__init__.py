@@ -1,2 +1,8 @@
-from .github_client import GitHubClient
+from .github_client import GitHubClient, get_github_client
 from .logger import get_logger
+
+__all__ = [
+    "GitHubClient",
+    "get_github_client",
+    "get_logger",
+]
@@ -6,13 +6,21 @@ Inline config (no external config file).
 
 from __future__ import annotations
 
+import copy
 import os
+import random
+import re
+import threading
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import requests
 
+from brewbridge.infrastructure.http_session import DEFAULT_STATUS_FORCELIST, build_session
 from brewbridge.infrastructure.logger import get_logger
 from brewbridge.utils.exceptions import (
     DatabricksAuthError,
@@ -26,6 +34,93 @@ from brewbridge.utils.exceptions import (
 
 logger = get_logger(__name__)
 
+# Let the warehouse hold the submit request open until the statement finishes
+# (API maximum is 50s); slower statements keep running and are polled.
+_SUBMIT_WAIT_SECONDS = 30
+_SUBMIT_WAIT_TIMEOUT = f"{_SUBMIT_WAIT_SECONDS}s"
+# The submit request's HTTP read timeout must outlast the server-side wait.
+_SUBMIT_HTTP_TIMEOUT_SECONDS = _SUBMIT_WAIT_SECONDS + 10
+
+# Poll delays grow 1s, 2s, 3s, ... up to this cap while a statement keeps running.
+_MAX_POLL_INTERVAL_SECONDS = 5.0
+
+# Environment variables DatabricksClient cannot start without.
+_REQUIRED_ENV = ("DATABRICKS_HOST", "DATABRICKS_TOKEN", "DATABRICKS_WAREHOUSE_ID")
+
+# Keep-alive connections per host; override with DATABRICKS_POOL_SIZE.
+_DEFAULT_POOL_SIZE = 10
+
+# Successful statement payloads keyed by (SQL, disposition, format); bounded LRU with a TTL.
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL_SECONDS = 300.0
+
+# read_table results up to this many rows come back inline as JSON; larger reads
+# are staged by the warehouse and downloaded as Arrow IPC streams.
+_INLINE_ROW_LIMIT = 25_000
+
+# Result chunk links and Arrow chunks of large reads are fetched this many at a time.
+_CHUNK_FETCH_WORKERS = 8
+
+CacheKey = Tuple[str, str, str]
+
+# Only read-only statements are cached; a repeated write must always execute.
+_CACHEABLE_SQL_RE = re.compile(r"^[\s(]*(SELECT|WITH)\b", re.IGNORECASE)
+
+# Error-message fragments that identify a stopped warehouse / a missing table.
+_WAREHOUSE_NOT_RUNNING_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "warehouse is not running",
+                "sql warehouse is not running",
+                "warehouse is in state stopped",
+                "warehouse is in state starting",
+                "cluster is not ready",
+                "cluster not ready",
+                "warehouse unavailable",
+                "warehouse failed",
+            ],
+        )
+    ),
+    re.IGNORECASE,
+)
+_TABLE_NOT_FOUND_RE = re.compile(
+    "|".join(
+        map(re.escape, ["table not found", "table or view not found", "object does not exist"])
+    ),
+    re.IGNORECASE,
+)
+
+# JSON_ARRAY results carry every value as a string; these Databricks column
+# types are converted to matching (nullable) pandas dtypes. Others stay object.
+_INT_DTYPES = {"BYTE": "Int8", "SHORT": "Int16", "INT": "Int32", "LONG": "Int64"}
+_FLOAT_DTYPES = {"FLOAT": "float32", "DOUBLE": "float64"}
+_DATETIME_TYPES = frozenset({"DATE", "TIMESTAMP", "TIMESTAMP_NTZ"})
+
+
+def _coerce_column(values: Sequence[Any], type_name: Optional[str]) -> Any:
+    """Convert one result column to the pandas dtype matching its Databricks type."""
+    type_name = (type_name or "").upper()
+    try:
+        if type_name in _INT_DTYPES:
+            # int() per value keeps LONGs exact; a float round trip would not.
+            ints = [None if v is None else int(v) for v in values]
+            return pd.array(ints, dtype=_INT_DTYPES[type_name])
+        if type_name in _FLOAT_DTYPES:
+            numbers = pd.to_numeric(pd.Series(values, dtype=object))
+            return numbers.astype(_FLOAT_DTYPES[type_name]).array
+        if type_name == "BOOLEAN":
+            flags = [None if v is None else str(v).lower() == "true" for v in values]
+            return pd.array(flags, dtype="boolean")
+        if type_name == "STRING":
+            return pd.array(values, dtype="string")
+        if type_name in _DATETIME_TYPES:
+            return pd.to_datetime(pd.Series(values, dtype=object)).array
+    except (TypeError, ValueError):
+        logger.debug("Could not coerce %s column; keeping object dtype.", type_name)
+    return pd.array(values, dtype=object)
+
 
 class DatabricksClient:
     """
@@ -35,29 +130,23 @@ class DatabricksClient:
 
     STATEMENTS_ENDPOINT = "/api/2.0/sql/statements"
 
-    def __init__(self):
+    def __init__(self, enable_cache: bool = True):
         """
         Loads configuration from environment variables directly.
         No DatabricksConfig class needed.
+
+        :param enable_cache: Reuse results of identical SQL for a few minutes.
         """
 
         # ------------------------------
         # Load env vars + validate
         # ------------------------------
 
-        host = os.getenv("DATABRICKS_HOST", "").strip()
-        token = os.getenv("DATABRICKS_TOKEN", "").strip()
-        warehouse_id = os.getenv("DATABRICKS_WAREHOUSE_ID", "").strip()
-
-        missing = [
-            k
-            for k, v in {
-                "DATABRICKS_HOST": host,
-                "DATABRICKS_TOKEN": token,
-                "DATABRICKS_WAREHOUSE_ID": warehouse_id,
-            }.items()
-            if not v
-        ]
+        required = [os.getenv(name, "").strip() for name in _REQUIRED_ENV]
+        host, token, warehouse_id = required
+        pool_size_raw = os.getenv("DATABRICKS_POOL_SIZE", "").strip()
+
+        missing = [name for name, value in zip(_REQUIRED_ENV, required) if not value]
 
         if missing:
             logger.error(
@@ -67,6 +156,13 @@ class DatabricksClient:
                 f"Missing required Databricks environment variables: {', '.join(missing)}"
             )
 
+        try:
+            pool_size = int(pool_size_raw) if pool_size_raw else _DEFAULT_POOL_SIZE
+        except ValueError:
+            raise DatabricksConfigError(
+                f"DATABRICKS_POOL_SIZE must be an integer, got '{pool_size_raw}'"
+            ) from None
+
         # Normalize host
         if host.endswith("/"):
             host = host[:-1]
@@ -77,14 +173,26 @@ class DatabricksClient:
         self.token = token
         self.warehouse_id = warehouse_id
 
-        # Polling defaults
-        self.poll_interval = 2.0
+        # Polling defaults: first delay, grown linearly per poll up to the cap.
+        self.poll_interval = 1.0
+        self.max_poll_interval = _MAX_POLL_INTERVAL_SECONDS
+
+        # (expires_at, payload) per statement; None when caching is disabled.
+        self._query_cache: Optional["OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]"] = (
+            OrderedDict() if enable_cache else None
+        )
+        self._cache_lock = threading.Lock()
         self.timeout_seconds = 120.0
 
         # ------------------------------
         # Init persistent session
         # ------------------------------
-        self.session = requests.Session()
+        # Pooled keep-alive connections; idempotent polls are retried on 429/5xx,
+        # statement submits (POST) are never replayed.
+        self.session = build_session(
+            pool_maxsize=pool_size,
+            status_forcelist=(429, *DEFAULT_STATUS_FORCELIST),
+        )
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {self.token}",
@@ -92,6 +200,9 @@ class DatabricksClient:
                 "Accept": "application/json",
             }
         )
+        # External result links are presigned cloud-storage URLs: they must not
+        # receive the Databricks bearer token, so they get their own session.
+        self.download_session = build_session(pool_maxsize=pool_size)
 
         logger.info(
             "DatabricksClient initialized successfully.",
@@ -105,15 +216,41 @@ class DatabricksClient:
     # PUBLIC API
     # ============================================================================
 
-    def run_query(self, sql: str) -> Dict[str, Any]:
+    def run_query(
+        self,
+        sql: str,
+        use_cache: bool = True,
+        disposition: str = "INLINE",
+        result_format: str = "JSON_ARRAY",
+    ) -> Dict[str, Any]:
         """
         Execute SQL and return final Databricks statement result.
-        """
-        preview = sql.replace("\n", " ")[:200]
-        logger.debug("Executing SQL on Databricks...", extra={"sql_preview": preview})
 
-        statement_id = self._submit_statement(sql)
-        return self._poll_statement(statement_id)
+        Successful inline results of SELECT / WITH statements are cached by SQL
+        text for a few minutes; pass `use_cache=False` to always hit the
+        warehouse. Writes, DDL and EXTERNAL_LINKS results (whose presigned URLs
+        expire) are never cached.
+        """
+        cache_key = (sql.strip(), disposition, result_format)
+        use_cache = (
+            use_cache and disposition == "INLINE" and _CACHEABLE_SQL_RE.match(sql) is not None
+        )
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.debug("Databricks query served from cache.")
+                return cached
+
+        payload = self._execute(sql, disposition, result_format)
+        if use_cache:
+            self._cache_put(cache_key, payload)
+        return payload
+
+    def clear_cache(self) -> None:
+        """Drop every cached query result."""
+        with self._cache_lock:
+            if self._query_cache is not None:
+                self._query_cache.clear()
 
     def ping(self) -> bool:
         """
@@ -121,7 +258,8 @@ class DatabricksClient:
         Returns True when the warehouse responds successfully.
         """
         try:
-            payload = self.run_query("SELECT 1")
+            # A connectivity check must reach the warehouse, never the cache.
+            payload = self.run_query("SELECT 1", use_cache=False)
         except DatabricksClientError:
             raise
         except Exception as exc:
@@ -134,24 +272,88 @@ class DatabricksClient:
 
     def read_table(self, table_path: str, limit: int = 1000) -> pd.DataFrame:
         sql = f"SELECT * FROM {table_path} LIMIT {int(limit)}"
-        payload = self.run_query(sql)
-        return self._payload_to_df(payload)
+        if int(limit) <= _INLINE_ROW_LIMIT:
+            payload = self.run_query(sql)
+            return self._payload_to_df(payload)
+
+        payload = self.run_query(sql, disposition="EXTERNAL_LINKS", result_format="ARROW_STREAM")
+        return self._arrow_payload_to_df(payload)
+
+    # ============================================================================
+    # INTERNAL — EXECUTION + CACHE
+    # ============================================================================
+
+    def _execute(self, sql: str, disposition: str, result_format: str) -> Dict[str, Any]:
+        preview = sql.replace("\n", " ")[:200]
+        logger.debug("Executing SQL on Databricks...", extra={"sql_preview": preview})
+
+        statement_id, payload = self._submit_statement(sql, disposition, result_format)
+        state = self._statement_state(payload)
+
+        # Short statements finish within the submit's wait_timeout; no polling needed.
+        if state == "SUCCEEDED":
+            return payload
+        if state in ("FAILED", "CANCELED", "CLOSED"):
+            self._raise_statement_error(payload)
+
+        try:
+            return self._poll_statement(statement_id)
+        except KeyboardInterrupt:
+            self._cancel_statement(statement_id)
+            raise
+
+    def _cache_get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            if self._query_cache is None:
+                return None
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if time.monotonic() >= expires_at:
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+        # Callers own the returned payload; keep the cached copy pristine.
+        return copy.deepcopy(payload)
+
+    def _cache_put(self, key: CacheKey, payload: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            if self._query_cache is None:
+                return
+            expires_at = time.monotonic() + _QUERY_CACHE_TTL_SECONDS
+            self._query_cache[key] = (expires_at, copy.deepcopy(payload))
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
 
     # ============================================================================
     # INTERNAL — SUBMIT
     # ============================================================================
 
-    def _submit_statement(self, sql: str) -> str:
+    def _submit_statement(
+        self, sql: str, disposition: str = "INLINE", result_format: str = "JSON_ARRAY"
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Submit a statement and return its id together with the submit response.
+
+        The response already carries the final status and result when the
+        statement completes within `wait_timeout`.
+        """
         url = f"{self.host}{self.STATEMENTS_ENDPOINT}"
         payload = {
             "statement": sql,
             "warehouse_id": self.warehouse_id,
+            "disposition": disposition,
+            "format": result_format,
+            "wait_timeout": _SUBMIT_WAIT_TIMEOUT,
+            "on_wait_timeout": "CONTINUE",
         }
 
         try:
-            res = self.session.post(url, json=payload, timeout=15)
+            res = self.session.post(url, json=payload, timeout=_SUBMIT_HTTP_TIMEOUT_SECONDS)
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error submitting Databricks statement: {e}")
+            logger.error("Error submitting Databricks statement: %s", e)
             raise DatabricksExecutionError(f"Error submitting SQL: {e}")
 
         self._handle_http_errors(res)
@@ -163,7 +365,7 @@ class DatabricksClient:
             logger.error("Databricks response missing statement_id.")
             raise DatabricksExecutionError("Databricks response missing statement_id.")
 
-        return statement_id
+        return statement_id, data
 
     # ============================================================================
     # INTERNAL — POLLING LOOP
@@ -172,41 +374,76 @@ class DatabricksClient:
     def _poll_statement(self, statement_id: str) -> Dict[str, Any]:
         url = f"{self.host}{self.STATEMENTS_ENDPOINT}/{statement_id}"
         start = time.time()
+        polls_in_state = 0
+        last_state = None
 
         while True:
             if time.time() - start > self.timeout_seconds:
+                # Otherwise the warehouse keeps running the abandoned statement.
+                self._cancel_statement(statement_id)
                 raise DatabricksTimeoutError(f"Timeout waiting for statement {statement_id}")
 
             try:
                 res = self.session.get(url, timeout=10)
             except requests.exceptions.RequestException as e:
-                logger.error(f"Error polling Databricks statement {statement_id}: {e}")
+                logger.error("Error polling Databricks statement %s: %s", statement_id, e)
                 raise DatabricksExecutionError(f"Polling error: {e}")
 
             self._handle_http_errors(res)
             payload = res.json()
 
-            state = (payload.get("status") or {}).get("state", "").upper()
+            state = self._statement_state(payload)
             logger.debug("Polling Databricks...", extra={"state": state})
 
             if state in ("PENDING", "RUNNING"):
-                time.sleep(self.poll_interval)
+                # Restart the backoff when the statement moves from queued to running.
+                polls_in_state = polls_in_state + 1 if state == last_state else 0
+                last_state = state
+                time.sleep(self._poll_delay(polls_in_state))
                 continue
 
             if state == "SUCCEEDED":
                 return payload
 
-            # FAILED / CANCELED / WAREHOUSE DOWN
-            error = payload.get("error") or {}
-            msg = error.get("message", "") or "Execution failed"
+            self._raise_statement_error(payload)
 
-            if self._is_warehouse_not_running(msg):
-                raise DatabricksWarehouseNotRunningError(msg)
+    def _cancel_statement(self, statement_id: str) -> None:
+        """Best-effort server-side cancel; failures are logged, never raised."""
+        url = f"{self.host}{self.STATEMENTS_ENDPOINT}/{statement_id}/cancel"
+        try:
+            res = self.session.post(url, json={}, timeout=10)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Could not cancel Databricks statement %s: %s", statement_id, e)
+            return
+        if not 200 <= res.status_code < 300:
+            logger.warning(
+                "Databricks cancel for statement %s returned HTTP %s",
+                statement_id,
+                res.status_code,
+            )
+
+    def _poll_delay(self, attempt: int) -> float:
+        """Linear backoff capped at `max_poll_interval`, with ±10% jitter across callers."""
+        delay = min(self.poll_interval * (attempt + 1), self.max_poll_interval)
+        # Non-cryptographic jitter; only keeps concurrent pollers out of lockstep.
+        return delay * random.uniform(0.9, 1.1)  # noqa: S311
+
+    @staticmethod
+    def _statement_state(payload: Dict[str, Any]) -> str:
+        return (payload.get("status") or {}).get("state", "").upper()
 
-            if self._is_table_not_found(msg):
-                raise DatabricksTableNotFoundError(msg)
+    def _raise_statement_error(self, payload: Dict[str, Any]) -> None:
+        """Map a FAILED / CANCELED / warehouse-down statement payload to a client error."""
+        error = payload.get("error") or {}
+        msg = error.get("message", "") or "Execution failed"
 
-            raise DatabricksExecutionError(msg)
+        if self._is_warehouse_not_running(msg):
+            raise DatabricksWarehouseNotRunningError(msg)
+
+        if self._is_table_not_found(msg):
+            raise DatabricksTableNotFoundError(msg)
+
+        raise DatabricksExecutionError(msg)
 
     # ============================================================================
     # INTERNAL — HTTP ERROR HANDLING
@@ -246,11 +483,100 @@ class DatabricksClient:
         rows = result.get("data_array") or []
 
         colnames = [c.get("name") for c in schema]
+        coltypes = [c.get("type_name") for c in schema]
 
         if not colnames and rows:
             colnames = [f"col_{i}" for i in range(len(rows[0]))]
+            coltypes = [None] * len(colnames)
 
-        return pd.DataFrame(rows, columns=colnames)
+        # Build column-major with dtypes taken from the schema instead of letting
+        # pandas box and infer every cell. Positional keys keep duplicate names apart.
+        columns = list(zip(*rows)) if rows else [()] * len(colnames)
+        df = pd.DataFrame(
+            {i: _coerce_column(values, coltypes[i]) for i, values in enumerate(columns)}
+        )
+        df.columns = colnames
+        return df
+
+    def _external_links(self, payload: Dict[str, Any]) -> List[str]:
+        """
+        Collect the presigned URLs of every result chunk.
+
+        When the manifest reports the chunk count, the remaining chunks are
+        requested concurrently by index; otherwise chunk links are followed.
+        """
+        first = payload.get("result") or {}
+        statement_id = payload.get("statement_id")
+        total_chunks = (payload.get("manifest") or {}).get("total_chunk_count") or 0
+
+        if statement_id and total_chunks > 1:
+            rest = self._map_chunks(
+                lambda index: self._fetch_chunk(statement_id, index), range(1, total_chunks)
+            )
+            return [
+                link["external_link"]
+                for chunk in [first, *rest]
+                for link in chunk.get("external_links") or []
+            ]
+
+        links: List[str] = []
+        chunk = first
+        while True:
+            chunk_links = chunk.get("external_links") or []
+            links.extend(link["external_link"] for link in chunk_links)
+            next_link = chunk_links[-1].get("next_chunk_internal_link") if chunk_links else None
+            if not next_link:
+                return links
+            chunk = self._get_chunk(f"{self.host}{next_link}")
+
+    def _fetch_chunk(self, statement_id: str, chunk_index: int) -> Dict[str, Any]:
+        return self._get_chunk(
+            f"{self.host}{self.STATEMENTS_ENDPOINT}/{statement_id}/result/chunks/{chunk_index}"
+        )
+
+    def _get_chunk(self, url: str) -> Dict[str, Any]:
+        try:
+            res = self.session.get(url, timeout=10)
+        except requests.exceptions.RequestException as e:
+            raise DatabricksExecutionError(f"Error fetching result chunk: {e}") from e
+        self._handle_http_errors(res)
+        return res.json()
+
+    def _download_chunk(self, link: str) -> bytes:
+        try:
+            res = self.download_session.get(link, timeout=60)
+            res.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise DatabricksExecutionError(f"Error downloading result chunk: {e}") from e
+        return res.content
+
+    @staticmethod
+    def _map_chunks(fn, items: Sequence[Any]) -> List[Any]:
+        """Apply `fn` to each item on a small thread pool, keeping input order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        workers = min(_CHUNK_FETCH_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dbx-chunk") as executor:
+            return list(executor.map(fn, items))
+
+    def _arrow_payload_to_df(self, payload: Dict[str, Any]) -> pd.DataFrame:
+        """Download ARROW_STREAM external links and build one DataFrame from them."""
+        links = self._external_links(payload)
+        if not links:
+            return self._payload_to_df(payload)
+
+        # pyarrow is only needed for large reads (it ships with mlflow); import on demand.
+        import pyarrow as pa
+
+        tables = [
+            pa.ipc.open_stream(content).read_all()
+            for content in self._map_chunks(self._download_chunk, links)
+        ]
+        table = pa.concat_tables(tables)
+        del tables
+        # Per-column blocks let Arrow free each buffer as it is converted, so the
+        # table and the DataFrame are never both fully resident.
+        return table.to_pandas(split_blocks=True, self_destruct=True)
 
     # ============================================================================
     # INTERNAL — ERROR DETECTION HELPERS
@@ -258,31 +584,20 @@ class DatabricksClient:
 
     @staticmethod
     def _is_warehouse_not_running(msg: str) -> bool:
-        if not msg:
-            return False
-
-        msg = msg.lower()
-        patterns = [
-            "warehouse is not running",
-            "sql warehouse is not running",
-            "warehouse is in state stopped",
-            "warehouse is in state starting",
-            "cluster is not ready",
-            "cluster not ready",
-            "warehouse unavailable",
-            "warehouse failed",
-        ]
-        return any(p in msg for p in patterns)
+        return bool(msg) and _WAREHOUSE_NOT_RUNNING_RE.search(msg) is not None
 
     @staticmethod
     def _is_table_not_found(msg: str) -> bool:
-        if not msg:
-            return False
-
-        msg = msg.lower()
-        patterns = [
-            "table not found",
-            "table or view not found",
-            "object does not exist",
-        ]
-        return any(p in msg for p in patterns)
+        return bool(msg) and _TABLE_NOT_FOUND_RE.search(msg) is not None
+
+
+@lru_cache(maxsize=1)
+def get_databricks_client() -> DatabricksClient:
+    """
+    Return the process-wide DatabricksClient built from the environment.
+
+    Reusing the instance keeps its pooled sessions, auth headers and query
+    cache alive across nodes. Call `get_databricks_client.cache_clear()` after
+    changing the DATABRICKS_* variables.
+    """
+    return DatabricksClient()
@@ -2,13 +2,21 @@
 Azure Data Factory client for connectivity checks and API operations.
 """
 
+import threading
+import time
+from functools import lru_cache
+
 import requests
 from typing import Optional
 from requests import Response, Session
+from brewbridge.infrastructure.http_session import build_session
 from brewbridge.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Refresh the Azure AD token this many seconds before it actually expires.
+_TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
 
 class ADFClient:
     """
@@ -37,8 +45,10 @@ class ADFClient:
         self.client_id = client_id
         self.client_secret = client_secret
         self.subscription_id = subscription_id
-        self.session: Session = requests.Session()
+        self.session: Session = build_session()
         self._access_token: Optional[str] = None
+        self._token_expiry = 0.0
+        self._token_lock = threading.Lock()
 
         logger.debug("ADFClient initialized.")
 
@@ -46,11 +56,17 @@ class ADFClient:
         """
         Obtain Azure AD access token using client credentials flow.
 
+        The token is reused until shortly before its `expires_in` deadline;
+        the lock keeps concurrent callers from requesting it in parallel.
+
         :return: Access token string
         """
-        if self._access_token:
-            return self._access_token
+        with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expiry:
+                return self._access_token
+            return self._request_access_token()
 
+    def _request_access_token(self) -> str:
         token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
         data = {
             "client_id": self.client_id,
@@ -60,14 +76,16 @@ class ADFClient:
         }
 
         try:
-            response = requests.post(token_url, data=data, timeout=10)
+            response = self.session.post(token_url, data=data, timeout=10)
             response.raise_for_status()
             token_data = response.json()
             self._access_token = token_data["access_token"]
+            expires_in = float(token_data.get("expires_in", 3600))
+            self._token_expiry = time.monotonic() + expires_in - _TOKEN_EXPIRY_MARGIN_SECONDS
             logger.debug("Successfully obtained Azure AD access token.")
             return self._access_token
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to obtain Azure AD token: {e}")
+            logger.error("Failed to obtain Azure AD token: %s", e)
             raise
 
     def ping(self) -> bool:
@@ -91,7 +109,7 @@ class ADFClient:
                 return True
 
             logger.warning(
-                f"Azure Data Factory ping failed with status code: {response.status_code}"
+                "Azure Data Factory ping failed with status code: %s", response.status_code
             )
             return False
 
@@ -99,8 +117,29 @@ class ADFClient:
             logger.error("Azure Data Factory ping timed out.")
             return False
         except requests.exceptions.RequestException as e:
-            logger.error(f"Azure Data Factory ping request failed: {e}")
+            logger.error("Azure Data Factory ping request failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Azure Data Factory ping failed: {e}")
+            logger.error("Azure Data Factory ping failed: %s", e)
             return False
+
+
+@lru_cache(maxsize=8)
+def get_adf_client(
+    tenant_id: str,
+    client_id: str,
+    client_secret: str,
+    subscription_id: Optional[str] = None,
+) -> ADFClient:
+    """
+    Return a shared ADFClient for the given service principal.
+
+    Reusing the instance keeps its pooled session and cached Azure AD token
+    alive across pings and later API calls in the process.
+    """
+    return ADFClient(
+        tenant_id=tenant_id,
+        client_id=client_id,
+        client_secret=client_secret,
+        subscription_id=subscription_id,
+    )
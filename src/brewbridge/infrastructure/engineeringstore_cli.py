@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from brewbridge.infrastructure.logger import get_logger
 from brewbridge.infrastructure.observability import log_cli_output
@@ -13,6 +14,21 @@ from brewbridge.utils.exceptions import (
     EngineeringStoreTimeoutError,
 )
 
+# CLI working directory (framework checkout) per table type.
+_WORKING_DIRS: Dict[str, str] = {
+    "gold": os.path.join("cache", "brewtiful"),
+    "brz": os.path.join("cache", "brewdat-pltfrm-ghq-tech-hopsflow"),
+    "slv": os.path.join("cache", "brewdat-pltfrm-ghq-tech-hopsflow"),
+}
+
+# Working directories already created in this process; skips the makedirs stat.
+_CREATED_DIRS: Set[str] = set()
+
+
+def _child_env() -> Dict[str, str]:
+    """Environment for the CLI with its stdio forced to UTF-8, whatever the locale."""
+    return {**os.environ, "PYTHONUTF8": "1", "PYTHONIOENCODING": "utf-8"}
+
 
 @dataclass(frozen=True)
 class EngineeringStoreCommand:
@@ -51,14 +67,12 @@ class EngineeringStoreCLI:
 
     def _resolve_working_dir(self, table_type: str) -> str:
         table_type = table_type.lower()
-
-        if table_type == "gold":
-            return os.path.join("cache", "brewtiful")
-
-        if table_type in ("brz", "slv"):
-            return os.path.join("cache", "brewdat-pltfrm-ghq-tech-hopsflow")
-
-        raise ValueError(f"Invalid table_type '{table_type}'. Expected 'gold', 'brz', or 'slv'.")
+        working_dir = _WORKING_DIRS.get(table_type)
+        if working_dir is None:
+            raise ValueError(
+                f"Invalid table_type '{table_type}'. Expected 'gold', 'brz', or 'slv'."
+            )
+        return working_dir
 
     def _execute(
         self, es_command: EngineeringStoreCommand, input_text: Optional[str] = None
@@ -66,23 +80,32 @@ class EngineeringStoreCLI:
         cmd_list = es_command.command
         working_dir = self._resolve_working_dir(es_command.table_type)
 
-        os.makedirs(working_dir, exist_ok=True)
+        if working_dir not in _CREATED_DIRS:
+            os.makedirs(working_dir, exist_ok=True)
+            _CREATED_DIRS.add(working_dir)
 
         self.logger.debug("Executing engineeringstore CLI command...")
-        self.logger.debug(f"CLI command: {cmd_list}")
-        self.logger.debug(f"Working directory: {working_dir}")
+        self.logger.debug("CLI command: %s", cmd_list)
+        self.logger.debug("Working directory: %s", working_dir)
 
         if input_text and es_command.needs_input:
             self.logger.debug("Passing stdin to CLI command")
         elif input_text and not es_command.needs_input:
             self.logger.warning("Input provided but command does not expect stdin")
 
+        stdin = input_text if input_text and es_command.needs_input else None
+
         try:
+            # Both ends speak UTF-8: the pipes are decoded explicitly here and the
+            # child (a Python CLI) is told to use UTF-8 instead of the locale code page.
             process = subprocess.run(
                 cmd_list,
                 cwd=working_dir,
-                input=input_text if es_command.needs_input else None,
+                input=stdin,
                 text=True,
+                encoding="utf-8",
+                errors="replace",
+                env=_child_env(),
                 capture_output=True,
                 timeout=self.timeout,
                 check=False,
@@ -99,18 +122,20 @@ class EngineeringStoreCLI:
             ) from e
 
         result = EngineeringStoreResult(
-            stdout=process.stdout or "", stderr=process.stderr or "", returncode=process.returncode
+            stdout=process.stdout or "",
+            stderr=process.stderr or "",
+            returncode=process.returncode,
         )
 
         log_cli_output(stdout=result.stdout, stderr=result.stderr)
 
         debug_env = os.environ.get("DEBUG", "false").lower() == "true"
-        if debug_env:
+        if debug_env and self.logger.isEnabledFor(logging.DEBUG):
             if result.stdout.strip():
-                self.logger.debug(f"[engineeringstore stdout]\n{result.stdout}")
+                self.logger.debug("[engineeringstore stdout]\n%s", result.stdout)
 
             if result.stderr.strip():
-                self.logger.debug(f"[engineeringstore stderr]\n{result.stderr}")
+                self.logger.debug("[engineeringstore stderr]\n%s", result.stderr)
 
         return result
 
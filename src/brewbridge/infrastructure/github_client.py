@@ -1,13 +1,33 @@
 import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 import requests
 from brewbridge.utils.constans import ConstansLibrary
 from requests import Response, Session
-from typing import List, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from brewbridge.utils.exceptions import GitHubAuthError, GitHubRequestError
+from brewbridge.infrastructure.http_session import DEFAULT_STATUS_FORCELIST, build_session
 from brewbridge.infrastructure.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Responses keyed by (kind, repo, branch, path); bounded LRU with a TTL. Expired
+# entries are revalidated with their ETag instead of being refetched.
+_CACHE_SIZE = 1024
+_CACHE_TTL_SECONDS = 300.0
+
+CacheKey = Tuple[str, str, str, str]
+
+# Aliased blob lookups per GraphQL request; well below GitHub's node limits.
+_GRAPHQL_BATCH_SIZE = 50
+
+_GRAPHQL_BLOB_FIELD = (
+    "f{index}: object(expression: {expression}) {{ ... on Blob {{ text isBinary isTruncated }} }}"
+)
+
 
 class GitHubClient:
     """
@@ -16,6 +36,8 @@ class GitHubClient:
     """
 
     BASE_URL = ConstansLibrary.GITHUB_API_URL
+    # Contents requests ask for the file body itself instead of base64 inside JSON.
+    RAW_ACCEPT_HEADER = "application/vnd.github.raw"
     ACCEPT_HEADER = ConstansLibrary.GITHUB_ACCEPT_HEADER
     API_VERSION_HEADER = ConstansLibrary.GITHUB_API_VERSION
 
@@ -24,7 +46,12 @@ class GitHubClient:
             logger.error("GitHubClient initialized without a valid token.")
             raise GitHubAuthError("Missing GitHub access token.")
 
-        self.session: Session = requests.Session()
+        # Secondary rate limits answer 429 with Retry-After, which urllib3 honours.
+        self.session: Session = build_session(
+            pool_connections=10,
+            pool_maxsize=20,
+            status_forcelist=(429, *DEFAULT_STATUS_FORCELIST),
+        )
         self.session.headers.update(
             {
                 "Authorization": f"Bearer {token}",
@@ -32,6 +59,11 @@ class GitHubClient:
                 "X-GitHub-Api-Version": self.API_VERSION_HEADER,
             }
         )
+        self._repos_url = f"{self.BASE_URL}/repos"
+        # (expires_at, etag, value) per request; see _cache_get / _cache_put.
+        self._cache: "OrderedDict[CacheKey, Tuple[float, Optional[str], Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_counts = {"hits": 0, "misses": 0, "revalidated": 0}
         logger.debug("GitHubClient initialized successfully.")
 
     def ping(self) -> bool:
@@ -46,14 +78,14 @@ class GitHubClient:
                 logger.info("GitHub API ping successful.")
                 return True
 
-            logger.warning(f"GitHub ping failed with status code: {res.status_code}")
+            logger.warning("GitHub ping failed with status code: %s", res.status_code)
             return False
 
         except requests.exceptions.Timeout:
             logger.error("GitHub ping timed out.")
             return False
         except requests.exceptions.RequestException as e:
-            logger.error(f"GitHub ping request failed: {e}")
+            logger.error("GitHub ping request failed: %s", e)
             return False
 
     def get_file(self, repo: str, path: str, branch: str = "main") -> str:
@@ -65,16 +97,32 @@ class GitHubClient:
         :param branch: Branch or ref to pull from (defaults to 'main').
         :return: Decoded string content of the file.
         """
-        url = f"{self.BASE_URL}/repos/{repo}/contents/{path}?ref={branch}"
-        logger.debug(f"Fetching file: {repo}/{path} @ {branch}")
+        url = self._contents_url(repo, path)
+        key = ("file", repo, branch, path)
+
+        fresh, etag, cached = self._cache_get(key)
+        if fresh:
+            return cached
+        logger.debug("Fetching file: %s/%s @ %s", repo, path, branch)
+
+        headers = {**(self._revalidate(etag) or {}), "Accept": self.RAW_ACCEPT_HEADER}
 
         try:
-            res: Response = self.session.get(url, timeout=20)
+            res: Response = self.session.get(
+                url, params={"ref": branch}, headers=headers, timeout=20
+            )
+
+            if res.status_code == 304 and cached is not None:
+                self._cache_put(key, etag, cached, revalidated=True)
+                return cached
 
             # Handle auth errors
             if res.status_code in [401, 403]:
                 logger.error(
-                    f"GitHub auth error ({res.status_code}). Token may be invalid, expired, or lack permissions for {repo}."
+                    "GitHub auth error (%s). Token may be invalid, expired, "
+                    "or lack permissions for %s.",
+                    res.status_code,
+                    repo,
                 )
                 raise GitHubAuthError(
                     f"Invalid/expired token or insufficient permissions for {repo}."
@@ -82,50 +130,68 @@ class GitHubClient:
 
             # Handle file not found
             if res.status_code == 404:
-                logger.error(f"File not found (404) at {url}")
+                logger.error("File not found (404) at %s", url)
                 raise GitHubRequestError(f"File not found: {path} in {repo}@{branch}")
 
             # Handle other HTTP errors
             res.raise_for_status()
 
-            data = res.json()
-            if isinstance(data, list) or "content" not in data:
-                logger.warning(f"Path '{path}' points to a directory, not a file.")
-                raise GitHubRequestError(f"Path is a directory, use list_directory instead: {path}")
-
-            # Decode Base64 content
-            content_b64 = data["content"]
-            decoded_content = base64.b64decode(content_b64).decode("utf-8")
-
-            logger.info(f"Successfully fetched and decoded file: {repo}/{path}")
+            decoded_content = self._decode_file_response(res, path)
+            logger.info("Successfully fetched and decoded file: %s/%s", repo, path)
+            self._cache_put(key, res.headers.get("ETag"), decoded_content)
             return decoded_content
 
         except base64.binascii.Error as e:
-            logger.error(f"Failed to decode Base64 content for {url}: {e}")
+            logger.error("Failed to decode Base64 content for %s: %s", url, e)
             raise GitHubRequestError(f"Failed to decode file content for {path}: {e}")
         except requests.exceptions.HTTPError as e:
-            logger.error(f"GitHub API HTTP error: {e}")
+            logger.error("GitHub API HTTP error: %s", e)
             raise GitHubRequestError(f"GitHub API error: {e.response.status_code}")
         except requests.exceptions.RequestException as e:
-            logger.error(f"GitHub get_file request failed: {e}")
+            logger.error("GitHub get_file request failed: %s", e)
             raise GitHubRequestError(f"Network error getting file: {e}")
 
+    @staticmethod
+    def _decode_file_response(res: Response, path: str) -> str:
+        """Decode a raw contents body, or the base64 `content` of a JSON response."""
+        # Raw bodies skip JSON and base64 entirely; directories still come back as JSON.
+        if not res.headers.get("Content-Type", "").startswith("application/json"):
+            return res.content.decode("utf-8")
+
+        data = res.json()
+        if isinstance(data, list) or "content" not in data:
+            logger.warning("Path '%s' points to a directory, not a file.", path)
+            raise GitHubRequestError(f"Path is a directory, use list_directory instead: {path}")
+
+        return base64.b64decode(data["content"]).decode("utf-8")
+
     def list_directory(self, repo: str, path: str, branch: str = "main") -> List[Dict]:
         """
         List files and directories in a specific path.
         Required for Strategies to discover files (e.g. "Find all JSONs in /pipelines").
         """
-        url = f"{self.BASE_URL}/repos/{repo}/contents/{path}?ref={branch}"
-        logger.debug(f"Listing directory: {repo}/{path} @ {branch}")
+        url = self._contents_url(repo, path)
+        key = ("dir", repo, branch, path)
+
+        fresh, etag, cached = self._cache_get(key)
+        if fresh:
+            return [dict(item) for item in cached]
+        logger.debug("Listing directory: %s/%s @ %s", repo, path, branch)
 
         try:
-            res: Response = self.session.get(url, timeout=10)
+            res: Response = self.session.get(
+                url, params={"ref": branch}, headers=self._revalidate(etag), timeout=10
+            )
+
+            if res.status_code == 304 and cached is not None:
+                self._cache_put(key, etag, cached, revalidated=True)
+                return [dict(item) for item in cached]
 
             if res.status_code in [401, 403]:
                 raise GitHubAuthError(f"Permission denied for {repo}")
 
             if res.status_code == 404:
-                logger.warning(f"Directory not found: {path}")
+                logger.warning("Directory not found: %s", path)
                 return []
 
             res.raise_for_status()
@@ -133,7 +199,7 @@ class GitHubClient:
             data = res.json()
 
             if not isinstance(data, list):
-                logger.warning(f"Path {path} is a file, not a directory.")
+                logger.warning("Path %s is a file, not a directory.", path)
                 return []
 
             items = [
@@ -145,8 +211,159 @@ class GitHubClient:
                 }
                 for item in data
             ]
-            return items
+            self._cache_put(key, res.headers.get("ETag"), items)
+            return [dict(item) for item in items]
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to list directory {path}: {e}")
+            logger.error("Failed to list directory %s: %s", path, e)
             raise GitHubRequestError(f"Network error listing directory: {e}")
+
+    def get_files(
+        self,
+        repo: str,
+        paths: Iterable[str],
+        branch: str = "main",
+        return_exceptions: bool = False,
+    ) -> Dict[str, Union[str, Exception]]:
+        """
+        Retrieve several text files, keyed by path in request order.
+
+        Up to 50 paths share one GraphQL request instead of one contents call
+        each. Binary or truncated blobs are read through `get_file`; results
+        share its cache.
+
+        :param return_exceptions: Store a failing path's exception as its value
+            instead of raising the first error.
+        """
+        owner, _, name = repo.partition("/")
+        unique_paths = list(dict.fromkeys(paths))
+        files: Dict[str, Union[str, Exception]] = {}
+        pending: List[str] = []
+        for path in unique_paths:
+            fresh, _, cached = self._cache_get(("file", repo, branch, path))
+            if fresh:
+                files[path] = cached
+            else:
+                pending.append(path)
+
+        for start in range(0, len(pending), _GRAPHQL_BATCH_SIZE):
+            batch = pending[start : start + _GRAPHQL_BATCH_SIZE]
+            try:
+                blobs = self._query_blobs(owner, name, branch, batch)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                files.update(dict.fromkeys(batch, e))
+                continue
+
+            for index, path in enumerate(batch):
+                try:
+                    files[path] = self._blob_text(repo, path, branch, blobs.get(f"f{index}"))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    files[path] = e
+
+        return {path: files[path] for path in unique_paths}
+
+    def _blob_text(self, repo: str, path: str, branch: str, blob: Optional[Dict[str, Any]]) -> str:
+        if blob is None:
+            raise GitHubRequestError(f"File not found: {path} in {repo}@{branch}")
+        text = blob.get("text")
+        # GraphQL omits binary text and cuts large blobs; the REST read does not.
+        if text is None or blob.get("isBinary") or blob.get("isTruncated"):
+            return self.get_file(repo, path, branch)
+        self._cache_put(("file", repo, branch, path), None, text)
+        return text
+
+    def _query_blobs(
+        self, owner: str, name: str, branch: str, paths: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Run one aliased GraphQL query and return the `repository` object keyed by alias."""
+        fields = " ".join(
+            _GRAPHQL_BLOB_FIELD.format(index=index, expression=json.dumps(f"{branch}:{path}"))
+            for index, path in enumerate(paths)
+        )
+        query = (
+            "query($owner: String!, $name: String!) "
+            f"{{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        )
+        payload = {"query": query, "variables": {"owner": owner, "name": name}}
+        logger.debug("Fetching %d files via GraphQL: %s/%s @ %s", len(paths), owner, name, branch)
+
+        try:
+            res: Response = self.session.post(f"{self.BASE_URL}/graphql", json=payload, timeout=30)
+
+            if res.status_code in [401, 403]:
+                raise GitHubAuthError(f"Permission denied for {owner}/{name}")
+
+            res.raise_for_status()
+            data = res.json()
+
+        except requests.exceptions.HTTPError as e:
+            logger.error("GitHub GraphQL HTTP error: %s", e)
+            raise GitHubRequestError(f"GitHub API error: {e.response.status_code}")
+        except requests.exceptions.RequestException as e:
+            logger.error("GitHub GraphQL request failed: %s", e)
+            raise GitHubRequestError(f"Network error getting files: {e}")
+
+        repository = (data.get("data") or {}).get("repository")
+        if repository is None:
+            errors = "; ".join(err.get("message", "") for err in data.get("errors") or [])
+            raise GitHubRequestError(f"GraphQL query failed for {owner}/{name}: {errors}")
+        return repository
+
+    def cache_clear(self) -> None:
+        """Drop every cached response and reset the counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            for name in self._cache_counts:
+                self._cache_counts[name] = 0
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return cache hits, misses, ETag revalidations (304s) and current size."""
+        with self._cache_lock:
+            return {**self._cache_counts, "size": len(self._cache)}
+
+    def _cache_get(self, key: CacheKey) -> Tuple[bool, Optional[str], Any]:
+        """Return (fresh, etag, value); stale entries keep their ETag for revalidation."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._cache_counts["misses"] += 1
+                return False, None, None
+            self._cache.move_to_end(key)
+            expires_at, etag, value = entry
+            fresh = time.monotonic() < expires_at
+            self._cache_counts["hits" if fresh else "misses"] += 1
+        return fresh, etag, value
+
+    def _cache_put(
+        self, key: CacheKey, etag: Optional[str], value: Any, revalidated: bool = False
+    ) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + _CACHE_TTL_SECONDS, etag, value)
+            self._cache.move_to_end(key)
+            if revalidated:
+                self._cache_counts["revalidated"] += 1
+            while len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _contents_url(self, repo: str, path: str) -> str:
+        """Contents-API URL of a path; the ref goes in `params` so requests encodes it."""
+        return f"{self._repos_url}/{repo}/contents/{path.lstrip('/')}"
+
+    @staticmethod
+    def _revalidate(etag: Optional[str]) -> Optional[Dict[str, str]]:
+        return {"If-None-Match": etag} if etag else None
+
+
+@lru_cache(maxsize=8)
+def get_github_client(token: str) -> GitHubClient:
+    """
+    Return a shared GitHubClient for the given token.
+
+    Reusing the instance keeps its pooled session (and open TLS connections)
+    alive across the preflight, extractor and any later node in the process.
+    """
+    return GitHubClient(token=token)
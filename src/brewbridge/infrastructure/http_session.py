@@ -0,0 +1,53 @@
+"""
+Shared factory for pooled `requests` sessions.
+
+Every HTTP client in BrewBridge talks to a handful of hosts repeatedly
+(GitHub, Azure management, Databricks, LLM providers). Mounting a sized
+`HTTPAdapter` keeps TLS connections alive between calls and lets urllib3
+handle transient 5xx failures with backoff instead of ad-hoc sleep loops.
+"""
+
+from __future__ import annotations
+
+from typing import Collection
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_STATUS_FORCELIST = (502, 503, 504)
+
+
+def build_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 10,
+    total_retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: Collection[int] = DEFAULT_STATUS_FORCELIST,
+) -> requests.Session:
+    """
+    Create a `requests.Session` with a pooled, retrying adapter for http and https.
+
+    :param pool_connections: Number of per-host connection pools to cache.
+    :param pool_maxsize: Maximum connections kept alive per host.
+    :param total_retries: Retries for connection errors and `status_forcelist` codes.
+    :param backoff_factor: Exponential backoff factor between retries.
+    :param status_forcelist: HTTP status codes that trigger a retry.
+    :return: Configured session.
+    """
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(status_forcelist),
+        # Hand the last response back to the caller instead of raising, so
+        # existing status-code checks keep working after retries are exhausted.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -8,10 +8,44 @@ has an active MLflow run (typically via the `track_node` decorator).
 
 from __future__ import annotations
 
-import json
 from typing import Any, Mapping
 
 import mlflow
+import orjson
+
+# Same layout as json.dumps(indent=2, ensure_ascii=False), encoded natively.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# State keys that are useful for debugging at the node level.
+_SNAPSHOT_KEYS = (
+    "environment_type",
+    "pipeline_info",
+    "normalized_schema_v4",
+    "pipeline_template",
+    "transform_template",
+    "notebook_template",
+)
+
+# Longer strings (rendered templates, notebooks) are cut in state snapshots.
+_MAX_SNAPSHOT_STRING = 64 * 1024
+_TRUNCATED_MARKER = "...<truncated>"
+
+
+def _to_json(obj: Any) -> str:
+    return orjson.dumps(obj, option=_JSON_OPTIONS).decode("utf-8")
+
+
+def _truncate_strings(value: Any) -> Any:
+    """Cap every string in a nested structure at `_MAX_SNAPSHOT_STRING` characters."""
+    if isinstance(value, str):
+        if len(value) > _MAX_SNAPSHOT_STRING:
+            return value[:_MAX_SNAPSHOT_STRING] + _TRUNCATED_MARKER
+        return value
+    if isinstance(value, Mapping):
+        return {key: _truncate_strings(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_truncate_strings(item) for item in value]
+    return value
 
 
 def log_yaml_before(content: str, artifact_path: str = "yaml_before.yaml") -> None:
@@ -53,7 +87,7 @@ def log_yaml_diff(diff: Mapping[str, Any], artifact_path: str = "yaml_diff.json"
     artifact_path:
         Relative path under the current run's artifact root.
     """
-    mlflow.log_text(json.dumps(diff, ensure_ascii=False, indent=2), artifact_path)
+    mlflow.log_text(_to_json(diff), artifact_path)
 
 
 def log_cli_output(stdout: str | None, stderr: str | None) -> None:
@@ -78,7 +112,7 @@ def log_state_snapshot(state: Mapping[str, Any], label: str = "state_snapshot")
     Log a compact JSON snapshot of the most relevant parts of the graph state.
 
     This intentionally avoids logging the entire state to keep artifacts small
-    and focused.
+    and focused; strings longer than 64 KiB are truncated.
 
     Parameters
     ----------
@@ -87,17 +121,9 @@ def log_state_snapshot(state: Mapping[str, Any], label: str = "state_snapshot")
     label:
         A short label that will be included in the artifact filename.
     """
-    # Only keep a subset of keys that are useful for debugging at the node level.
-    keys_of_interest = [
-        "environment_type",
-        "pipeline_info",
-        "normalized_schema_v4",
-        "pipeline_template",
-        "transform_template",
-        "notebook_template",
-    ]
-
-    snapshot: dict[str, Any] = {key: state.get(key) for key in keys_of_interest if key in state}
+    snapshot: dict[str, Any] = {
+        key: _truncate_strings(state[key]) for key in _SNAPSHOT_KEYS if key in state
+    }
 
     artifact_path = f"{label}.json"
-    mlflow.log_text(json.dumps(snapshot, ensure_ascii=False, indent=2), artifact_path)
+    mlflow.log_text(_to_json(snapshot), artifact_path)
@@ -23,6 +23,19 @@ mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://127.0.0.1:8080"
 mlflow.langchain.autolog()
 
 
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write `content` atomically, leaving the file untouched when it is already identical."""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def main():
     logger = get_logger("brewbridge")
     manifest_path = Path(__file__).parent.parent.parent / "inputs" / "samples" / "manifest.yaml"
@@ -80,7 +93,7 @@ def main():
         img = Image.open(BytesIO(png_bytes))
         img.show()
     except Exception as e:
-        logger.warning(f"No se pudo generar la imagen del grafo: {e}")
+        logger.warning("No se pudo generar la imagen del grafo: %s", e)
 
     start_pipeline_run(state)
     logger.info("🎥 Observabilidad iniciada (MLflow run created)")
@@ -94,15 +107,16 @@ def main():
         logger.info("✅ Grafo finalizado exitosamente.")
         # Save final_state_obj to final_state.json in the project root
         root_path = Path(__file__).parent.parent.parent
-        with open(root_path / "final_state.json", "w") as f:
-            json.dump(final_state_obj.model_dump(), f, indent=2)
+        _write_if_changed(
+            root_path / "final_state.json", json.dumps(final_state_obj.model_dump(), indent=2)
+        )
         # logger.debug(f"Estado Final: {final_state_obj}")
 
         end_pipeline_run(status="success")
         logger.info("🎥 Observabilidad finalizada (Status: Success)")
 
     except Exception as e:
-        logger.error(f"💥 Error crítico durante la ejecución del grafo: {e}")
+        logger.error("💥 Error crítico durante la ejecución del grafo: %s", e)
 
         end_pipeline_run(status="failed")
         raise e
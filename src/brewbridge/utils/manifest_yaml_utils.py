@@ -13,6 +13,7 @@ source_platform: platform_3_0
 # quality_repo: brewdat/quality_repo
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -22,6 +23,11 @@ from pydantic import BaseModel, Field
 from brewbridge.infrastructure.logger import get_logger
 from brewbridge.utils.exceptions import ManifestNotFoundError, ManifestParseError
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = get_logger(__name__)
 
 
@@ -39,35 +45,50 @@ class ManifestModel(BaseModel):
     quality_repo: Optional[str] = None
 
 
-def load_manifest(manifest_path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=16)
+def _parse_manifest(resolved_path: str, mtime_ns: int) -> ManifestModel:
     """
-    Load and parse a manifest.yaml file.
+    Parse and validate a manifest file.
 
-    :param manifest_path: Path to the manifest.yaml file
-    :return: Parsed manifest as a dictionary
-    :raises ManifestNotFoundError: If the file doesn't exist
-    :raises ManifestParseError: If the file cannot be parsed or validated
+    Cached on (path, mtime) so repeated loads in one process skip the YAML
+    parse until the file changes on disk.
     """
-    path = Path(manifest_path)
-
-    if not path.exists():
-        logger.error(f"Manifest file not found: {manifest_path}")
-        raise ManifestNotFoundError(f"Manifest file not found: {manifest_path}")
-
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = yaml.safe_load(f)
+        # Bytes go straight to libyaml, which detects the encoding itself.
+        with open(resolved_path, "rb") as f:
+            content = yaml.load(f, Loader=_SafeLoader)
 
         if content is None:
             raise ManifestParseError("Manifest file is empty or invalid")
 
-        manifest = ManifestModel(**content)
-        logger.info(f"Successfully loaded and validated manifest: {manifest_path}")
-        return manifest.model_dump()
+        return ManifestModel(**content)
 
     except yaml.YAMLError as e:
-        logger.error(f"Failed to parse YAML: {e}")
+        logger.error("Failed to parse YAML: %s", e)
         raise ManifestParseError(f"Invalid YAML syntax: {e}")
     except Exception as e:
-        logger.error(f"Failed to validate manifest: {e}")
+        logger.error("Failed to validate manifest: %s", e)
         raise ManifestParseError(f"Manifest validation failed: {e}")
+
+
+def load_manifest(manifest_path: str) -> Dict[str, Any]:
+    """
+    Load and parse a manifest.yaml file.
+
+    :param manifest_path: Path to the manifest.yaml file
+    :return: Parsed manifest as a dictionary
+    :raises ManifestNotFoundError: If the file doesn't exist
+    :raises ManifestParseError: If the file cannot be parsed or validated
+    """
+    path = Path(manifest_path)
+
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.error("Manifest file not found: %s", manifest_path)
+        raise ManifestNotFoundError(f"Manifest file not found: {manifest_path}")
+
+    manifest = _parse_manifest(str(path.resolve()), mtime_ns)
+    logger.info("Successfully loaded and validated manifest: %s", manifest_path)
+    # model_dump builds a fresh dict, so callers may mutate it without touching the cache.
+    return manifest.model_dump()
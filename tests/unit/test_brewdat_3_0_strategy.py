@@ -0,0 +1,103 @@
+"""
+Unit tests for Brewdat3Strategy.
+"""
+
+from __future__ import annotations
+
+import json
+
+from brewbridge.domain.extractor_strategies.brewdat.brewdat_3_0_strategy import Brewdat3Strategy
+
+_TRIGGER = {
+    "properties": {
+        "pipelines": [
+            {
+                "pipelineReference": {"referenceName": "pl_sap"},
+                "parameters": {
+                    "items_to_process": {
+                        "pipelines": [
+                            {
+                                "load_to_bronze": {"adb_notebook_path": "//repo/brz/ingest"},
+                                "load_to_silver": {
+                                    "target_table": "mx_dd02l",
+                                    "adb_notebook_path": "//repo/slv/merge",
+                                    "source_system": "sap",
+                                    "source_system_country": "mx",
+                                    "target_database": "slv_db",
+                                },
+                            },
+                            {
+                                "load_to_bronze": {
+                                    "target_table": "mx_t001",
+                                    "adb_notebook_path": "//repo/brz/ingest",
+                                },
+                            },
+                        ]
+                    }
+                },
+            }
+        ]
+    }
+}
+
+
+class FakeGitHubClient:
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.calls = []
+
+    def get_file(self, repo, path):
+        self.calls.append((repo, path))
+        if path in self.missing:
+            raise FileNotFoundError(path)
+        if path.startswith("trigger/"):
+            return json.dumps(_TRIGGER)
+        if path.startswith("pipeline/"):
+            return json.dumps({"name": "pl_sap"})
+        return f"content of {path}"
+
+    def get_files(self, repo, paths, branch="main", return_exceptions=False):
+        files = {}
+        for path in dict.fromkeys(paths):
+            try:
+                files[path] = self.get_file(repo, path)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                files[path] = e
+        return files
+
+    def list_directory(self, repo, path):
+        return []
+
+
+def test_fetch_artifacts_downloads_unique_notebooks_and_quality_rules():
+    client = FakeGitHubClient()
+    artifacts = Brewdat3Strategy(github_client=client).fetch_artifacts(
+        {"repo_name": "sap-repo-adf", "trigger_name": "tr_slv_sap"}
+    )
+
+    assert set(artifacts["notebooks_source"]) == {"brz/ingest.py", "slv/merge.py"}
+    assert [c for c in client.calls if c[1] == "brz/ingest.py"] == [
+        ("sap-repo-adb", "brz/ingest.py")
+    ]
+    assert list(artifacts["quality_rules"]) == ["mx_dd02l"]
+    silver = next(i for i in artifacts["items"] if i["table_name"] == "mx_dd02l")
+    assert silver["governance_path"].endswith("/dq_definitions/mx/slv_db/mx_dd02l.yaml")
+
+
+def test_fetch_artifacts_tolerates_failed_downloads():
+    client = FakeGitHubClient(missing={"slv/merge.py"})
+    client_missing_rules = FakeGitHubClient(
+        missing={"src/maz/maz/tech/sap/dq_definitions/mx/slv_db/mx_dd02l.yaml"}
+    )
+
+    artifacts = Brewdat3Strategy(github_client=client).fetch_artifacts(
+        {"repo_name": "sap-repo-adf", "trigger_name": "tr_slv_sap"}
+    )
+    no_rules = Brewdat3Strategy(github_client=client_missing_rules).fetch_artifacts(
+        {"repo_name": "sap-repo-adf", "trigger_name": "tr_slv_sap"}
+    )
+
+    assert artifacts["notebooks_source"]["slv/merge.py"].startswith("# ERROR:")
+    assert no_rules["quality_rules"] == {}
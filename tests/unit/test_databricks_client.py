@@ -1,20 +1,27 @@
+import pyarrow as pa
 import pytest
 
-from brewbridge.infrastructure.databricks_client import DatabricksClient
+from brewbridge.infrastructure.databricks_client import DatabricksClient, get_databricks_client
 from brewbridge.utils.exceptions import (
+    DatabricksConfigError,
     DatabricksExecutionError,
+    DatabricksTableNotFoundError,
     DatabricksTimeoutError,
 )
 
 
 class FakeResponse:
-    def __init__(self, json_data=None, status_code=200):
+    def __init__(self, json_data=None, status_code=200, content=b""):
         self._json = json_data or {}
         self.status_code = status_code
+        self.content = content
 
     def json(self):
         return self._json
 
+    def raise_for_status(self):
+        return None
+
 
 class FakeSession:
     """
@@ -25,8 +32,14 @@ class FakeSession:
         self.post_response = post_response
         self.get_responses = list(get_responses)
         self.headers = {}
+        self.posted = []
+        self.posted_urls = []
+        self.post_timeouts = []
 
     def post(self, url, json, timeout):
+        self.posted.append(json)
+        self.posted_urls.append(url)
+        self.post_timeouts.append(timeout)
         return self.post_response
 
     def get(self, url, timeout):
@@ -35,6 +48,18 @@ class FakeSession:
         return self.get_responses.pop(0)
 
 
+class UrlSession:
+    """Serves GETs by URL, so concurrent chunk fetches stay deterministic."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, timeout):
+        self.requested.append(url)
+        return self.responses[url]
+
+
 @pytest.fixture(autouse=True)
 def databricks_env(monkeypatch):
     monkeypatch.setenv("DATABRICKS_HOST", "https://fake.databricks.com")
@@ -63,6 +88,62 @@ def test_run_query_polls_until_success(monkeypatch):
     assert payload["result"]["data_array"] == [[1]]
 
 
+def test_run_query_returns_inline_result_without_polling():
+    post_response = FakeResponse(
+        {
+            "statement_id": "abc",
+            "status": {"state": "SUCCEEDED"},
+            "result": {"data_array": [[1]]},
+        }
+    )
+
+    client = DatabricksClient()
+    client.session = FakeSession(post_response, [])
+
+    payload = client.run_query("SELECT 1")
+
+    assert payload["result"]["data_array"] == [[1]]
+    assert client.session.posted[0]["wait_timeout"] == "30s"
+    assert client.session.posted[0]["on_wait_timeout"] == "CONTINUE"
+
+
+def test_run_query_maps_inline_failure_without_polling():
+    post_response = FakeResponse(
+        {
+            "statement_id": "abc",
+            "status": {"state": "FAILED"},
+            "error": {"message": "Table or view not found: x"},
+        }
+    )
+
+    client = DatabricksClient()
+    client.session = FakeSession(post_response, [])
+
+    with pytest.raises(DatabricksTableNotFoundError):
+        client.run_query("SELECT * FROM x")
+
+
+def test_submit_http_timeout_outlasts_wait_timeout():
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([[1]]), [])
+
+    client.run_query("SELECT 1", use_cache=False)
+
+    wait_seconds = int(client.session.posted[0]["wait_timeout"].rstrip("s"))
+    assert client.session.post_timeouts[0] > wait_seconds
+
+
+def test_poll_delay_grows_linearly_up_to_cap():
+    client = DatabricksClient()
+
+    delays = [client._poll_delay(attempt) for attempt in range(8)]
+
+    assert 0.9 <= delays[0] <= 1.1
+    assert 1.8 <= delays[1] <= 2.2
+    assert all(d <= client.max_poll_interval * 1.1 for d in delays)
+    assert delays[-1] >= client.max_poll_interval * 0.9
+
+
 def test_run_query_missing_statement_id_raises():
     client = DatabricksClient()
     client.session = FakeSession(FakeResponse({"unexpected": "payload"}), [])
@@ -71,10 +152,67 @@ def test_run_query_missing_statement_id_raises():
         client.run_query("SELECT 1")
 
 
+def _succeeded(rows):
+    return FakeResponse(
+        {"statement_id": "abc", "status": {"state": "SUCCEEDED"}, "result": {"data_array": rows}}
+    )
+
+
+def test_identical_queries_are_served_from_cache():
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([[1]]), [])
+
+    first = client.run_query("SELECT * FROM t")
+    first["result"]["data_array"].append([2])
+    second = client.run_query("SELECT * FROM t")
+
+    assert len(client.session.posted) == 1
+    assert second["result"]["data_array"] == [[1]]
+
+
+def test_cache_can_be_bypassed_and_cleared():
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([[1]]), [])
+
+    client.run_query("SELECT * FROM t")
+    client.run_query("SELECT * FROM t", use_cache=False)
+    client.clear_cache()
+    client.run_query("SELECT * FROM t")
+
+    assert len(client.session.posted) == 3
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "INSERT INTO t VALUES (1)",
+        "MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN DELETE",
+        "CREATE TABLE t (id INT)",
+    ],
+)
+def test_writes_are_never_cached(sql):
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([]), [])
+
+    client.run_query(sql)
+    client.run_query(sql)
+
+    assert len(client.session.posted) == 2
+
+
+def test_ping_always_reaches_the_warehouse():
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([[1]]), [])
+
+    assert client.ping() is True
+    assert client.ping() is True
+    assert len(client.session.posted) == 2
+
+
 def test_ping_returns_true_when_rows(monkeypatch):
     client = DatabricksClient()
 
-    def fake_run_query(sql):
+    def fake_run_query(sql, use_cache=True):
         return {"result": {"data_array": [[1]]}}
 
     monkeypatch.setattr(client, "run_query", fake_run_query)
@@ -85,7 +223,7 @@ def test_ping_returns_true_when_rows(monkeypatch):
 def test_ping_passthrough_databricks_error(monkeypatch):
     client = DatabricksClient()
 
-    def fake_run_query(sql):
+    def fake_run_query(sql, use_cache=True):
         raise DatabricksTimeoutError("timeout")
 
     monkeypatch.setattr(client, "run_query", fake_run_query)
@@ -94,13 +232,187 @@ def test_ping_passthrough_databricks_error(monkeypatch):
         client.ping()
 
 
+def test_poll_timeout_cancels_statement():
+    client = DatabricksClient()
+    client.session = FakeSession(
+        FakeResponse({"statement_id": "abc", "status": {"state": "PENDING"}}), []
+    )
+    client.timeout_seconds = -1
+
+    with pytest.raises(DatabricksTimeoutError):
+        client.run_query("SELECT 1", use_cache=False)
+
+    assert client.session.posted_urls[-1] == (
+        "https://fake.databricks.com/api/2.0/sql/statements/abc/cancel"
+    )
+
+
 def test_ping_wraps_unexpected_errors(monkeypatch):
     client = DatabricksClient()
 
-    def fake_run_query(sql):
+    def fake_run_query(sql, use_cache=True):
         raise ValueError("boom")
 
     monkeypatch.setattr(client, "run_query", fake_run_query)
 
     with pytest.raises(DatabricksExecutionError):
         client.ping()
+
+
+def test_session_pool_size_comes_from_env(monkeypatch):
+    monkeypatch.setenv("DATABRICKS_POOL_SIZE", "32")
+
+    client = DatabricksClient()
+
+    adapter = client.session.get_adapter("https://fake.databricks.com")
+    assert adapter._pool_maxsize == 32
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_invalid_pool_size_raises_config_error(monkeypatch):
+    monkeypatch.setenv("DATABRICKS_POOL_SIZE", "many")
+
+    with pytest.raises(DatabricksConfigError):
+        DatabricksClient()
+
+
+def _arrow_stream(values):
+    table = pa.table({"id": values})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def test_small_reads_request_inline_json():
+    client = DatabricksClient()
+    client.session = FakeSession(_succeeded([[1]]), [])
+
+    client.read_table("cat.sch.t", limit=10)
+
+    assert client.session.posted[0]["disposition"] == "INLINE"
+    assert client.session.posted[0]["format"] == "JSON_ARRAY"
+
+
+def test_large_reads_download_arrow_chunks():
+    first_link = {
+        "external_link": "https://storage/0",
+        "next_chunk_internal_link": "/api/2.0/sql/statements/abc/result/chunks/1",
+    }
+    post_response = FakeResponse(
+        {
+            "statement_id": "abc",
+            "status": {"state": "SUCCEEDED"},
+            "result": {"external_links": [first_link]},
+        }
+    )
+    next_chunk = FakeResponse({"external_links": [{"external_link": "https://storage/1"}]})
+    client = DatabricksClient()
+    client.session = FakeSession(post_response, [next_chunk])
+    client.download_session = UrlSession(
+        {
+            "https://storage/0": FakeResponse(content=_arrow_stream([1, 2])),
+            "https://storage/1": FakeResponse(content=_arrow_stream([3])),
+        }
+    )
+
+    df = client.read_table("cat.sch.t", limit=100_000)
+
+    assert client.session.posted[0]["disposition"] == "EXTERNAL_LINKS"
+    assert client.session.posted[0]["format"] == "ARROW_STREAM"
+    assert df["id"].tolist() == [1, 2, 3]
+
+
+def test_large_reads_fetch_manifest_chunks_by_index():
+    client = DatabricksClient()
+    client.session = FakeSession(None, [])
+    chunks_url = "https://fake.databricks.com/api/2.0/sql/statements/abc/result/chunks"
+    client.session.get = UrlSession(
+        {
+            f"{chunks_url}/{i}": FakeResponse(
+                {"external_links": [{"external_link": f"https://storage/{i}"}]}
+            )
+            for i in (1, 2)
+        }
+    ).get
+    client.download_session = UrlSession(
+        {f"https://storage/{i}": FakeResponse(content=_arrow_stream([i])) for i in range(3)}
+    )
+    payload = {
+        "statement_id": "abc",
+        "manifest": {"total_chunk_count": 3},
+        "result": {"external_links": [{"external_link": "https://storage/0"}]},
+    }
+
+    df = client._arrow_payload_to_df(payload)
+
+    assert df["id"].tolist() == [0, 1, 2]
+
+
+def test_payload_to_df_applies_schema_dtypes():
+    payload = {
+        "result": {
+            "schema": {
+                "columns": [
+                    {"name": "id", "type_name": "LONG"},
+                    {"name": "name", "type_name": "STRING"},
+                    {"name": "active", "type_name": "BOOLEAN"},
+                    {"name": "price", "type_name": "DOUBLE"},
+                ]
+            },
+            "data_array": [["9007199254740993", "a", "true", "1.5"], [None, None, None, None]],
+        }
+    }
+
+    df = DatabricksClient._payload_to_df(payload)
+
+    assert [str(t) for t in df.dtypes] == ["Int64", "string", "boolean", "float64"]
+    assert df["id"][0] == 9007199254740993
+    assert df["active"][0]
+    assert df["id"].isna()[1]
+
+
+@pytest.mark.parametrize(
+    "type_name, values",
+    [
+        ("DOUBLE", ["1.5", "abc"]),
+        ("DATE", ["2024-01-02", "not-a-date"]),
+    ],
+)
+def test_unparseable_columns_keep_original_values(type_name, values):
+    payload = {
+        "result": {
+            "schema": {"columns": [{"name": "c", "type_name": type_name}]},
+            "data_array": [[v] for v in values],
+        }
+    }
+
+    df = DatabricksClient._payload_to_df(payload)
+
+    # Uncoerced: the raw strings survive (object, or "str" under pandas 3).
+    assert df["c"].tolist() == values
+
+
+@pytest.mark.parametrize(
+    "msg, warehouse_down, table_missing",
+    [
+        ("SQL Warehouse is NOT running", True, False),
+        ("[TABLE_OR_VIEW_NOT_FOUND] Table or view not found: x", False, True),
+        ("Syntax error", False, False),
+        ("", False, False),
+    ],
+)
+def test_error_message_classifiers(msg, warehouse_down, table_missing):
+    assert DatabricksClient._is_warehouse_not_running(msg) is warehouse_down
+    assert DatabricksClient._is_table_not_found(msg) is table_missing
+
+
+def test_get_databricks_client_reuses_instance():
+    get_databricks_client.cache_clear()
+    try:
+        client = get_databricks_client()
+
+        assert get_databricks_client() is client
+        assert isinstance(client, DatabricksClient)
+    finally:
+        get_databricks_client.cache_clear()
@@ -0,0 +1,65 @@
+"""
+Unit tests for ADFClient token handling.
+"""
+
+from __future__ import annotations
+
+from brewbridge.infrastructure import datafactory_client
+from brewbridge.infrastructure.datafactory_client import ADFClient, get_adf_client
+
+
+class FakeResponse:
+    def __init__(self, json_data):
+        self._json = json_data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._json
+
+
+class FakeSession:
+    def __init__(self):
+        self.token_requests = 0
+
+    def post(self, url, data, timeout):
+        self.token_requests += 1
+        return FakeResponse({"access_token": f"token-{self.token_requests}", "expires_in": 3600})
+
+
+def _client():
+    client = ADFClient(tenant_id="tenant", client_id="client", client_secret="secret")
+    client.session = FakeSession()
+    return client
+
+
+def test_token_is_reused_until_expiry(monkeypatch):
+    monkeypatch.setattr(datafactory_client.time, "monotonic", lambda: 1000.0)
+    client = _client()
+
+    assert client._get_access_token() == "token-1"
+    assert client._get_access_token() == "token-1"
+    assert client.session.token_requests == 1
+
+
+def test_token_is_refreshed_near_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(datafactory_client.time, "monotonic", lambda: now[0])
+    client = _client()
+
+    client._get_access_token()
+    now[0] += 3600 - 30  # inside the refresh margin
+
+    assert client._get_access_token() == "token-2"
+
+
+def test_get_adf_client_reuses_instance_per_credentials():
+    get_adf_client.cache_clear()
+    try:
+        first = get_adf_client("tenant", "client", "secret")
+
+        assert get_adf_client("tenant", "client", "secret") is first
+        assert get_adf_client("tenant", "client", "other-secret") is not first
+    finally:
+        get_adf_client.cache_clear()
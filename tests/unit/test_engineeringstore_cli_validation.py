@@ -14,7 +14,7 @@ from brewbridge.utils.exceptions import EngineeringStoreExecutionError
 def test_run_with_result_returns_outputs(monkeypatch):
     calls = {}
 
-    def fake_run(cmd_list, cwd, input, text, capture_output, timeout, check):
+    def fake_run(cmd_list, cwd, input, text, encoding, errors, env, capture_output, timeout, check):
         calls["cmd_list"] = cmd_list
         calls["cwd"] = cwd
         process = subprocess.CompletedProcess(args=cmd_list, returncode=2)
@@ -39,7 +39,7 @@ def test_run_with_result_returns_outputs(monkeypatch):
 
 
 def test_run_with_result_raises_with_context(monkeypatch):
-    def fake_run(cmd_list, cwd, input, text, capture_output, timeout, check):
+    def fake_run(cmd_list, cwd, input, text, encoding, errors, env, capture_output, timeout, check):
         process = subprocess.CompletedProcess(args=cmd_list, returncode=1)
         process.stdout = "bad stdout"
         process.stderr = "bad stderr"
@@ -59,3 +59,56 @@ def test_run_with_result_raises_with_context(monkeypatch):
     assert err.returncode == 1
     assert err.stdout == "bad stdout"
     assert err.stderr == "bad stderr"
+
+
+def test_stdio_is_utf8_regardless_of_locale(monkeypatch):
+    sent = {}
+
+    def fake_run(cmd_list, cwd, input, text, encoding, errors, env, capture_output, timeout, check):
+        sent.update(input=input, text=text, encoding=encoding)
+        sent["env"] = {k: env[k] for k in ("PYTHONUTF8", "PYTHONIOENCODING")}
+        process = subprocess.CompletedProcess(args=cmd_list, returncode=0)
+        process.stdout = "créé"
+        process.stderr = ""
+        return process
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    command = EngineeringStoreCommand(
+        command=["engineeringstore", "ingestion", "--create-template-files"],
+        table_type="brz",
+        needs_input=True,
+    )
+    stdout = EngineeringStoreCLI().run(command, input_text="zoné\nmaz\n")
+
+    assert sent == {
+        "input": "zoné\nmaz\n",
+        "text": True,
+        "encoding": "utf-8",
+        "env": {"PYTHONUTF8": "1", "PYTHONIOENCODING": "utf-8"},
+    }
+    assert stdout == "créé"
+
+
+def test_working_dir_is_created_once(monkeypatch):
+    from brewbridge.infrastructure import engineeringstore_cli
+
+    made = []
+    monkeypatch.setattr(engineeringstore_cli, "_CREATED_DIRS", set())
+    monkeypatch.setattr(
+        engineeringstore_cli.os, "makedirs", lambda path, exist_ok: made.append(path)
+    )
+
+    def fake_run(cmd_list, cwd, input, text, encoding, errors, env, capture_output, timeout, check):
+        process = subprocess.CompletedProcess(args=cmd_list, returncode=0)
+        process.stdout = ""
+        process.stderr = ""
+        return process
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    cli = EngineeringStoreCLI()
+    for table_type in ("brz", "slv", "gold", "brz"):
+        cli.run(EngineeringStoreCommand(command=["engineeringstore"], table_type=table_type))
+
+    assert len(made) == 2
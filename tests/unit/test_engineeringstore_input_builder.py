@@ -0,0 +1,72 @@
+"""
+Unit tests for the engineeringstore prompt builders.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from brewbridge.domain.extractor_strategies.engineeringstore_input_builder import (
+    BrewtifulGLDInputStrategy,
+    EngineeringStoreInputBuilderFactory,
+    build_engineeringstore_inputs,
+)
+
+_SCHEMA = {
+    "zone": "afr",
+    "country": "za",
+    "acl": "y",
+    "transformations": "n",
+    "trigger": "y",
+    "schedule": "0 3 * * *",
+}
+
+
+@pytest.mark.parametrize(
+    ("environment", "schema", "metadata", "expected"),
+    [
+        (
+            "brz",
+            {},
+            {},
+            "maz\nmaz\n\nunknown\nunknown_pipeline\n* * * * *\nraw_table\nplatform\n"
+            "blob\nsap\nsap\nsap\nsap-secret\nnn\n",
+        ),
+        (
+            "slv",
+            _SCHEMA,
+            {"pipeline_name": "pl"},
+            "afr\nafr\nza\nunknown\npl\n0 3 * * *\nraw_table\nplatform\n"
+            "blob\nsap\nsap\nsap\nsap-secret\nny\n",
+        ),
+        (
+            "slv",
+            {},
+            {},
+            "maz\nmaz\n\nunknown\nunknown_pipeline\n* * * * *\nraw_table\nplatform\n"
+            "blob\nsap\nsap\nsap\nsap-secret\nyn\n",
+        ),
+        (
+            "gld",
+            {},
+            {},
+            "maz\nmaz\nmz\nunknown\nunknown_pipeline\n* * * * *\nfeature_table\nplatform\n"
+            "transformation\n\ndefault\nnn\n",
+        ),
+        (
+            "gld",
+            _SCHEMA,
+            {"pipeline_name": "pl"},
+            "afr\nafr\nza\nunknown\npl\n0 3 * * *\nfeature_table\nplatform\n"
+            "transformation\n\ndefault\nyy\n",
+        ),
+    ],
+)
+def test_prompts_are_byte_for_byte_stable(environment, schema, metadata, expected):
+    assert build_engineeringstore_inputs(schema, metadata, environment) == expected
+
+
+def test_factory_reuses_strategy_instances():
+    factory = EngineeringStoreInputBuilderFactory
+    assert factory.get("slv") is factory.get("slv")
+    assert isinstance(factory.get("anything-else"), BrewtifulGLDInputStrategy)
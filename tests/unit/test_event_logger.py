@@ -365,3 +365,22 @@ class TestLogStateSnapshot:
         snapshot = json.loads(logged_json)
         assert snapshot["pipeline_info"]["config"]["nested"]["deeply"]["key"] == "value"
         assert snapshot["pipeline_info"]["list"][2]["inner"] == "data"
+
+    @patch("brewbridge.infrastructure.observability.event_logger.mlflow")
+    def test_truncates_long_strings(self, mock_mlflow: MagicMock) -> None:
+        """Test that log_state_snapshot cuts oversized strings, including nested ones."""
+        # Arrange
+        long_text = "x" * (64 * 1024 + 10)
+        state = {
+            "notebook_template": long_text,
+            "pipeline_info": {"notebooks": [long_text, "short"]},
+        }
+
+        # Act
+        log_state_snapshot(state)
+
+        # Assert
+        snapshot = json.loads(mock_mlflow.log_text.call_args[0][0])
+        expected = "x" * (64 * 1024) + "...<truncated>"
+        assert snapshot["notebook_template"] == expected
+        assert snapshot["pipeline_info"]["notebooks"] == [expected, "short"]
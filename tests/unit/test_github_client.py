@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import pytest
+
+from brewbridge.infrastructure import github_client
+from brewbridge.infrastructure.github_client import GitHubClient, get_github_client
+from brewbridge.utils.exceptions import GitHubAuthError, GitHubRequestError
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    get_github_client.cache_clear()
+    yield
+    get_github_client.cache_clear()
+
+
+def test_get_github_client_reuses_instance_per_token():
+    first = get_github_client("token-a")
+
+    assert get_github_client("token-a") is first
+    assert get_github_client("token-b") is not first
+    assert isinstance(first, GitHubClient)
+
+
+def test_get_github_client_pools_connections():
+    adapter = get_github_client("token-a").session.get_adapter("https://api.github.com")
+
+    assert adapter._pool_maxsize == 20
+    assert 429 in adapter.max_retries.status_forcelist
+
+
+def test_get_github_client_rejects_empty_token():
+    with pytest.raises(GitHubAuthError):
+        get_github_client("")
+
+
+class FakeResponse:
+    def __init__(self, status_code, json_data=None, etag=None, content=None):
+        self.status_code = status_code
+        self._json = json_data or {}
+        self.content = content
+        self.headers = {"Content-Type": "application/json" if content is None else "text/plain"}
+        if etag:
+            self.headers["ETag"] = etag
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        return None
+
+
+def test_get_file_is_served_from_cache_within_ttl(monkeypatch):
+    client = GitHubClient(token="token-a")
+    calls = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        calls.append((url, params))
+        assert headers["Accept"] == "application/vnd.github.raw"
+        return FakeResponse(200, etag='"f1"', content=b"hello")
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+
+    assert client.get_file("org/repo", "a.txt") == "hello"
+    assert client.get_file("org/repo", "a.txt") == "hello"
+    assert client.get_file("org/repo", "a.txt", branch="dev") == "hello"
+
+    assert calls == [
+        ("https://api.github.com/repos/org/repo/contents/a.txt", {"ref": "main"}),
+        ("https://api.github.com/repos/org/repo/contents/a.txt", {"ref": "dev"}),
+    ]
+    assert client.cache_stats() == {"hits": 1, "misses": 2, "revalidated": 0, "size": 2}
+
+    client.cache_clear()
+    assert client.cache_stats()["size"] == 0
+
+
+def test_get_file_revalidates_expired_entries_with_etag(monkeypatch):
+    client = GitHubClient(token="token-a")
+    responses = [FakeResponse(200, etag='"v1"', content=b"hello"), FakeResponse(304)]
+    sent_headers = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers.get("If-None-Match"))
+        return responses.pop(0)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    clock = [1000.0]
+    monkeypatch.setattr(github_client.time, "monotonic", lambda: clock[0])
+
+    assert client.get_file("org/repo", "a.txt") == "hello"
+    clock[0] += 301  # past the TTL: revalidate instead of serving from cache
+    assert client.get_file("org/repo", "a.txt") == "hello"
+
+    assert sent_headers == [None, '"v1"']
+    assert client.cache_stats()["revalidated"] == 1
+
+
+def test_get_file_decodes_base64_json_content(monkeypatch):
+    client = GitHubClient(token="token-a")
+    monkeypatch.setattr(
+        client.session,
+        "get",
+        lambda url, params=None, headers=None, timeout=None: FakeResponse(
+            200, {"content": "aGVsbG8=", "encoding": "base64"}
+        ),
+    )
+
+    assert client.get_file("org/repo", "a.txt") == "hello"
+
+
+def test_get_files_batches_through_graphql(monkeypatch):
+    client = GitHubClient(token="token-a")
+    queries = []
+
+    def fake_post(url, json, timeout):
+        queries.append(json)
+        return FakeResponse(
+            200,
+            {
+                "data": {
+                    "repository": {
+                        "f0": {"text": "print(1)", "isBinary": False, "isTruncated": False},
+                        "f1": {"text": None, "isBinary": True, "isTruncated": False},
+                        "f2": {"text": "partial", "isBinary": False, "isTruncated": True},
+                        "f3": None,
+                    }
+                }
+            },
+        )
+
+    monkeypatch.setattr(client.session, "post", fake_post)
+    monkeypatch.setattr(client, "get_file", lambda repo, path, branch="main": f"rest:{path}")
+
+    paths = ["a.py", "logo.png", "big.py", "missing.py", "a.py"]
+    files = client.get_files("org/repo", paths, branch="dev", return_exceptions=True)
+
+    assert list(files) == ["a.py", "logo.png", "big.py", "missing.py"]
+    assert files["a.py"] == "print(1)"
+    assert files["logo.png"] == "rest:logo.png"
+    assert files["big.py"] == "rest:big.py"
+    assert isinstance(files["missing.py"], GitHubRequestError)
+    assert len(queries) == 1
+    assert '"dev:a.py"' in queries[0]["query"]
+    assert queries[0]["variables"] == {"owner": "org", "name": "repo"}
+
+
+def test_get_files_raises_without_return_exceptions(monkeypatch):
+    client = GitHubClient(token="token-a")
+    monkeypatch.setattr(
+        client.session,
+        "post",
+        lambda url, json, timeout: FakeResponse(200, {"data": {"repository": {"f0": None}}}),
+    )
+
+    with pytest.raises(GitHubRequestError):
+        client.get_files("org/repo", ["missing.py"])
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from requests.adapters import HTTPAdapter
+
+from brewbridge.infrastructure.http_session import build_session
+
+
+def test_build_session_mounts_retrying_adapter_for_both_schemes():
+    session = build_session(pool_maxsize=7, total_retries=2, status_forcelist=(503,))
+
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(f"{prefix}example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.status_forcelist == (503,)
+        assert adapter.max_retries.raise_on_status is False
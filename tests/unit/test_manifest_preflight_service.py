@@ -0,0 +1,70 @@
+"""
+Unit tests for ManifestPreflightService.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, Mock, patch
+
+from brewbridge.domain.services import read_manifest_and_check_api as preflight
+from brewbridge.domain.services.read_manifest_and_check_api import ManifestPreflightService
+
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    response.__enter__.return_value = response
+    return response
+
+
+class TestPingLlmApis:
+    @patch.object(preflight, "_SESSION")
+    def test_openai_ping_uses_head(self, mock_session):
+        mock_session.head.return_value = _response(200)
+
+        assert ManifestPreflightService().ping_llm_apis({"OPENAI_API_KEY": "sk-test"}) is True
+        mock_session.get.assert_not_called()
+
+    @patch.object(preflight, "_SESSION")
+    def test_openai_ping_falls_back_to_streamed_get(self, mock_session):
+        mock_session.head.return_value = _response(405)
+        mock_session.get.return_value = _response(200)
+
+        assert ManifestPreflightService().ping_llm_apis({"OPENAI_API_KEY": "sk-test"}) is True
+        assert mock_session.get.call_args.kwargs["stream"] is True
+
+    @patch.object(preflight, "_SESSION")
+    def test_openai_ping_rejects_unauthorized(self, mock_session):
+        mock_session.head.return_value = _response(401)
+
+        assert ManifestPreflightService().ping_llm_apis({"OPENAI_API_KEY": "bad"}) is False
+
+    def test_no_llm_credentials(self):
+        assert ManifestPreflightService().ping_llm_apis({}) is False
+
+
+class TestCollectEnvCredentials:
+    def test_only_non_empty_values_are_collected(self, monkeypatch):
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        monkeypatch.setenv("OPENAI_API_KEY", "")
+        monkeypatch.delenv("ASIMOV_URL", raising=False)
+
+        creds = ManifestPreflightService().collect_env_credentials()
+
+        assert creds["GITHUB_TOKEN"] == "token"
+        assert "OPENAI_API_KEY" not in creds
+        assert "ASIMOV_URL" not in creds
+
+
+@patch.object(preflight, "get_github_client")
+def test_ping_github_uses_shared_client(mock_factory):
+    mock_factory.return_value = Mock(ping=Mock(return_value=True))
+
+    assert ManifestPreflightService().ping_github({"GITHUB_TOKEN": "token"}) is True
+    mock_factory.assert_called_once_with("token")
+
+
+def test_backoff_delay_grows_exponentially_and_is_capped():
+    with patch.object(preflight.random, "random", return_value=0.0):
+        assert [preflight._backoff_delay(n) for n in range(3)] == [0.2, 0.4, 0.8]
+        assert preflight._backoff_delay(10) == preflight._BACKOFF_MAX_SECONDS
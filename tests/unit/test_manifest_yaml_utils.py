@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from brewbridge.utils.exceptions import ManifestNotFoundError, ManifestParseError
+from brewbridge.utils.manifest_yaml_utils import load_manifest
+
+MANIFEST = """\
+pipeline_info:
+  repo_name: BrewDat/brewdat-maz-maz-tech-sap-repo-adf
+  trigger_name: tr_slv_maz_tech_metadata_sap_pr0_mx_d_0500
+access_groups:
+  - AADS_A_Brewdat-ghq-p-ghq-mark-mroi-rw
+"""
+
+
+def test_load_manifest_returns_validated_dict(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text(MANIFEST)
+
+    manifest = load_manifest(str(path))
+
+    assert manifest["pipeline_info"]["trigger_name"].startswith("tr_slv")
+    assert manifest["source_platform"] == "platform_3_0"
+
+
+def test_load_manifest_returns_independent_copies(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text(MANIFEST)
+
+    first = load_manifest(str(path))
+    first["access_groups"].append("mutated")
+
+    assert load_manifest(str(path))["access_groups"] == ["AADS_A_Brewdat-ghq-p-ghq-mark-mroi-rw"]
+
+
+def test_load_manifest_reparses_after_file_changes(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text(MANIFEST)
+    load_manifest(str(path))
+
+    path.write_text(MANIFEST.replace("platform_3_0", "x") + "source_platform: cobos\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_manifest(str(path))["source_platform"] == "cobos"
+
+
+def test_load_manifest_missing_file(tmp_path):
+    with pytest.raises(ManifestNotFoundError):
+        load_manifest(str(tmp_path / "missing.yaml"))
+
+
+def test_load_manifest_empty_file(tmp_path):
+    path = tmp_path / "manifest.yaml"
+    path.write_text("")
+
+    with pytest.raises(ManifestParseError):
+        load_manifest(str(path))
@@ -149,12 +149,12 @@ class TestPingFunctions:
 
         assert result is False
 
-    @patch.object(_read_manifest_module, "ADFClient")
-    def test_ping_adf_success(self, mock_adf_client_class):
+    @patch.object(_read_manifest_module, "get_adf_client")
+    def test_ping_adf_success(self, mock_get_adf_client):
         """Test successful ADF ping."""
         mock_client = Mock()
         mock_client.ping.return_value = True
-        mock_adf_client_class.return_value = mock_client
+        mock_get_adf_client.return_value = mock_client
 
         credentials = {
             "ADF_TENANT_ID": "tenant",
@@ -0,0 +1,233 @@
+"""
+Unit tests for RepoClonerService.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from brewbridge.domain.services import repo_cloner_service
+from brewbridge.domain.services.repo_cloner_service import (
+    BREWTIFUL_REPO,
+    HOPSFLOW_REPO,
+    RepoClonerService,
+    _discard_directory,
+    _purge_dead_directories,
+    _unlock_and_retry,
+)
+from brewbridge.utils.exceptions import RepositoryCloneError
+
+
+@pytest.fixture(autouse=True)
+def clear_remote_heads():
+    repo_cloner_service._REMOTE_HEADS.clear()
+    yield
+    repo_cloner_service._REMOTE_HEADS.clear()
+
+
+def _git_outputs(remote_sha, local_sha, status=""):
+    def run_git(*args):
+        if "ls-remote" in args:
+            return f"{remote_sha}\tHEAD\n"
+        if "rev-parse" in args:
+            return f"{local_sha}\n"
+        if "status" in args:
+            return status
+        return ""
+
+    return run_git
+
+
+def test_unlock_and_retry_clears_read_only_bit(tmp_path):
+    target = tmp_path / "pack.idx"
+    target.write_text("data")
+    os.chmod(target, stat.S_IREAD)
+
+    _unlock_and_retry(os.remove, str(target), None)
+
+    assert not target.exists()
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_non_git_directory_is_removed_and_recloned(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+    destination.mkdir()
+    (destination / "stale.txt").write_text("leftover")
+
+    RepoClonerService()._clone_or_pull_repo("brewtiful", destination, "token")
+
+    assert not (destination / "stale.txt").exists()
+    args = mock_git.call_args.args
+    assert args[0] == "clone"
+    assert any("token@github.com" in arg for arg in args)
+
+
+def test_discard_directory_renames_aside_and_deletes_in_background(tmp_path):
+    destination = tmp_path / "brewtiful"
+    destination.mkdir()
+    (destination / "stale.txt").write_text("leftover")
+
+    with patch.object(repo_cloner_service, "_delete_in_background") as mock_delete:
+        _discard_directory(destination)
+
+    assert not destination.exists()
+    dead = mock_delete.call_args.args[0]
+    assert dead.name.startswith("brewtiful.dead.")
+    assert (dead / "stale.txt").exists()
+
+
+def test_purge_dead_directories_only_targets_leftovers(tmp_path):
+    (tmp_path / "brewtiful").mkdir()
+    (tmp_path / "brewtiful.dead.123.456").mkdir()
+
+    with patch.object(repo_cloner_service, "_delete_in_background") as mock_delete:
+        _purge_dead_directories(tmp_path)
+
+    mock_delete.assert_called_once_with(tmp_path / "brewtiful.dead.123.456")
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_clone_is_shallow_single_branch(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+
+    RepoClonerService()._clone_or_pull_repo("brewtiful", destination, "token")
+
+    args = mock_git.call_args.args
+    assert args[0] == "clone"
+    assert "--depth=1" in args
+    assert "--single-branch" in args
+    assert args[-1] == str(destination)
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_update_fetches_tip_and_hard_resets(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+    (destination / ".git").mkdir(parents=True)
+    mock_git.side_effect = _git_outputs("remote-sha", "local-sha")
+
+    RepoClonerService()._clone_or_pull_repo("brewtiful", destination, "token")
+
+    assert [c.args for c in mock_git.call_args_list][-2:] == [
+        ("-C", str(destination), "fetch", "--depth=1", "origin"),
+        ("-C", str(destination), "reset", "--hard", "origin/HEAD"),
+    ]
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_update_removes_stale_index_lock(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+    (destination / ".git").mkdir(parents=True)
+    (destination / ".git" / "index.lock").write_text("")
+    mock_git.side_effect = _git_outputs("abc123", "abc123")
+
+    RepoClonerService()._clone_or_pull_repo("brewtiful", destination, "token")
+
+    assert not (destination / ".git" / "index.lock").exists()
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_update_is_skipped_when_local_head_matches_remote(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+    (destination / ".git").mkdir(parents=True)
+    mock_git.side_effect = _git_outputs("abc123", "abc123")
+
+    service = RepoClonerService()
+    service._clone_or_pull_repo("brewtiful", destination, "token")
+    service._clone_or_pull_repo("brewtiful", destination, "token")
+
+    commands = [c.args[2] for c in mock_git.call_args_list]
+    assert commands == ["ls-remote", "rev-parse", "status", "rev-parse", "status"]
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_up_to_date_dirty_tree_is_reset(mock_git, tmp_path):
+    destination = tmp_path / "brewtiful"
+    (destination / ".git").mkdir(parents=True)
+    mock_git.side_effect = _git_outputs("abc123", "abc123", status=" M dags/config.yaml\n")
+
+    RepoClonerService()._clone_or_pull_repo("brewtiful", destination, "token")
+
+    commands = [c.args[2:] for c in mock_git.call_args_list]
+    assert ("reset", "--hard", "HEAD") in commands
+    assert not any(c[0] == "fetch" for c in commands)
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_remote_head_is_looked_up_again_after_ttl(mock_git, tmp_path, monkeypatch):
+    destination = tmp_path / "brewtiful"
+    (destination / ".git").mkdir(parents=True)
+    mock_git.side_effect = _git_outputs("abc123", "abc123")
+    clock = iter([0.0, repo_cloner_service._REMOTE_HEAD_TTL_SECONDS + 1])
+    monkeypatch.setattr(repo_cloner_service.time, "monotonic", lambda: next(clock))
+
+    service = RepoClonerService()
+    service._clone_or_pull_repo("brewtiful", destination, "token")
+    service._clone_or_pull_repo("brewtiful", destination, "token")
+
+    commands = [c.args[2] for c in mock_git.call_args_list]
+    assert commands == ["ls-remote", "rev-parse", "status", "ls-remote", "rev-parse", "status"]
+
+
+@patch.object(repo_cloner_service, "_run_git")
+def test_git_failure_raises_clone_error_without_token(mock_git, tmp_path):
+    mock_git.side_effect = subprocess.CalledProcessError(
+        128,
+        ["git", "clone", "https://secret-token@github.com/BrewDat/brewtiful.git"],
+        stderr="fatal: could not read from https://secret-token@github.com/",
+    )
+
+    with pytest.raises(RepositoryCloneError) as excinfo:
+        RepoClonerService()._clone_or_pull_repo("brewtiful", tmp_path / "b", "secret-token")
+
+    assert "secret-token" not in str(excinfo.value)
+    assert "exit 128" in str(excinfo.value)
+
+
+class TestDetectRequiredFrameworks:
+    def test_gold_maps_to_brewtiful(self):
+        assert RepoClonerService()._detect_required_frameworks(["tr_gld_maz_sales"]) == {
+            BREWTIFUL_REPO
+        }
+
+    def test_bronze_and_silver_map_to_hopsflow(self):
+        names = ["BRZ_logistics", "tr_slv_maz_tech_metadata_sap"]
+        assert RepoClonerService()._detect_required_frameworks(names) == {HOPSFLOW_REPO}
+
+    def test_mixed_names_require_both(self):
+        names = ["gld_sales", "slv_sales", "unrelated"]
+        assert RepoClonerService()._detect_required_frameworks(names) == {
+            BREWTIFUL_REPO,
+            HOPSFLOW_REPO,
+        }
+
+    def test_no_match_returns_empty_set(self):
+        assert RepoClonerService()._detect_required_frameworks(["pipeline_x"]) == set()
+
+
+@patch.object(RepoClonerService, "_clone_or_pull_repo")
+def test_prepare_repositories_clones_only_detected_framework(mock_clone):
+    cloned = RepoClonerService().prepare_repositories("token", ["slv"])
+
+    assert cloned == [HOPSFLOW_REPO]
+    mock_clone.assert_called_once()
+
+
+@patch.object(RepoClonerService, "_clone_or_pull_repo")
+def test_prepare_repositories_falls_back_to_all_frameworks(mock_clone):
+    cloned = RepoClonerService().prepare_repositories("token")
+
+    assert cloned == sorted([BREWTIFUL_REPO, HOPSFLOW_REPO])
+    assert mock_clone.call_count == 2
+
+
+@patch.object(RepoClonerService, "_clone_or_pull_repo")
+def test_prepare_repositories_propagates_clone_errors(mock_clone):
+    mock_clone.side_effect = RepositoryCloneError("Clone failed")
+
+    with pytest.raises(RepositoryCloneError, match="Clone failed"):
+        RepoClonerService().prepare_repositories("token", ["gld"])
@@ -0,0 +1,94 @@
+"""
+Unit tests for the read_manifest_and_check_api tool node.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from brewbridge.core.state import MigrationGraphState
+from brewbridge.domain.services.read_manifest_and_check_api import ManifestPreflightService
+from brewbridge.domain.tools import set_up
+from brewbridge.domain.tools.set_up import read_manifest_and_check_api
+from brewbridge.utils.exceptions import ManifestNotFoundError
+
+_ENV_KEYS = [
+    "GITHUB_TOKEN",
+    "ADF_TENANT_ID",
+    "ADF_CLIENT_ID",
+    "ADF_CLIENT_SECRET",
+    "ASIMOV_URL",
+    "ASIMOV_PRODUCT_TOKEN",
+    "OPENAI_API_KEY",
+    "DATABRICKS_HOST",
+    "DATABRICKS_TOKEN",
+    "DATABRICKS_WAREHOUSE_ID",
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for key in _ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+def _patch_pings(monkeypatch, **outcomes):
+    called = []
+
+    def make_ping(name):
+        def ping(self, credentials):
+            called.append(name)
+            return outcomes[name]
+
+        return ping
+
+    for name in ("github", "adf", "databricks", "llm_apis"):
+        monkeypatch.setattr(ManifestPreflightService, f"ping_{name}", make_ping(name))
+    return called
+
+
+def test_only_configured_apis_are_pinged(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    called = _patch_pings(monkeypatch, github=True, adf=False, databricks=False, llm_apis=True)
+
+    state = read_manifest_and_check_api(MigrationGraphState(manifest_path="manifest.yaml"))
+
+    assert sorted(called) == ["github", "llm_apis"]
+    assert state.api_connectivity_ok is True
+    assert state.credentials["GITHUB_TOKEN"] == "token"
+
+
+def test_failed_optional_ping_marks_connectivity_failed(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setenv("ADF_TENANT_ID", "tenant")
+    monkeypatch.setenv("ADF_CLIENT_ID", "client")
+    monkeypatch.setenv("ADF_CLIENT_SECRET", "secret")
+    _patch_pings(monkeypatch, github=True, adf=False, databricks=True, llm_apis=True)
+
+    state = read_manifest_and_check_api(MigrationGraphState(manifest_path="manifest.yaml"))
+
+    assert state.api_connectivity_ok is False
+
+
+def test_missing_github_token_fails_connectivity(monkeypatch):
+    called = _patch_pings(monkeypatch, github=True, adf=True, databricks=True, llm_apis=True)
+
+    state = read_manifest_and_check_api(MigrationGraphState(manifest_path="manifest.yaml"))
+
+    assert called == []
+    assert state.api_connectivity_ok is False
+
+
+def test_raising_ping_counts_as_failure():
+    def boom(credentials):
+        raise RuntimeError("network down")
+
+    results = set_up._run_pings_concurrently({"github": boom, "llm": lambda credentials: True}, {})
+
+    assert results == {"github": False, "llm": True}
+
+
+def test_missing_manifest_path_raises():
+    with pytest.raises(ManifestNotFoundError):
+        read_manifest_and_check_api(MigrationGraphState())
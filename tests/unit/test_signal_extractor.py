@@ -0,0 +1,51 @@
+"""
+Unit tests for signal_extractor_node.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from brewbridge.core.state import MigrationGraphState
+from brewbridge.domain.tools import signal_extractor
+from brewbridge.domain.tools.signal_extractor import signal_extractor_node
+
+_ARTIFACTS = {"trigger_json": {"name": "tr_slv_sap"}, "items": [{"table_name": "mx_dd02l"}]}
+
+
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    signal_extractor._SUMMARY_CACHE.clear()
+    yield
+    signal_extractor._SUMMARY_CACHE.clear()
+
+
+def test_digest_ignores_key_order():
+    reordered = {"items": _ARTIFACTS["items"], "trigger_json": _ARTIFACTS["trigger_json"]}
+    assert signal_extractor._artifacts_digest(_ARTIFACTS) == signal_extractor._artifacts_digest(
+        reordered
+    )
+
+
+@patch.object(signal_extractor.BrewdatSignalExtractor, "extract")
+def test_identical_artifacts_reuse_cached_summary(mock_extract):
+    mock_extract.return_value = {"pipeline_name": "tr_slv_sap", "tables": []}
+
+    first = signal_extractor_node(MigrationGraphState(raw_artifacts=dict(_ARTIFACTS)))
+    first.signal_summary["tables"].append("mutated")
+    second = signal_extractor_node(MigrationGraphState(raw_artifacts=dict(_ARTIFACTS)))
+
+    mock_extract.assert_called_once()
+    assert second.signal_summary == {"pipeline_name": "tr_slv_sap", "tables": []}
+
+
+@patch.object(signal_extractor.BrewdatSignalExtractor, "extract")
+def test_changed_artifacts_are_extracted_again(mock_extract):
+    mock_extract.return_value = {}
+
+    signal_extractor_node(MigrationGraphState(raw_artifacts=dict(_ARTIFACTS)))
+    signal_extractor_node(MigrationGraphState(raw_artifacts={**_ARTIFACTS, "items": []}))
+
+    assert mock_extract.call_count == 2
@@ -0,0 +1,33 @@
+"""
+Unit tests for BrewdatSignalExtractor.
+"""
+
+from __future__ import annotations
+
+from brewbridge.domain.extractor_strategies.brewdat import signal_extractor_pipeline
+from brewbridge.domain.extractor_strategies.brewdat.signal_extractor_pipeline import (
+    BrewdatSignalExtractor,
+)
+
+_RAW_ARTIFACTS = {
+    "trigger_json": {"name": "tr_slv_sap"},
+    "items": [
+        {"silver_config": {"target_table": f"table_{i}", "source_system": "sap"}} for i in range(5)
+    ],
+    "manifest_yaml": "connection_id: sap-prod-secret\n",
+    "metadata_yaml": "state:\n  metadata:\n    access_groups: [grp]\n",
+}
+
+
+def test_embedded_yaml_is_parsed_once_per_document():
+    signal_extractor_pipeline._load_embedded_yaml.cache_clear()
+
+    summary = BrewdatSignalExtractor().extract(_RAW_ARTIFACTS)
+
+    tables = summary["tables"].values()
+    assert {t["connection_id"] for t in tables} == {"sap-prod-secret"}
+    assert {t["acl"] for t in tables} == {"y"}
+    cache_info = signal_extractor_pipeline._load_embedded_yaml.cache_info()
+    assert cache_info.misses == 2
+    # Pipeline-level signals are resolved once per extraction, not once per table.
+    assert cache_info.hits == 0
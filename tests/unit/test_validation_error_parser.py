@@ -37,7 +37,7 @@ def test_parse_mixed_blocks_and_grouping():
     messages = {err["message"] for err in acl_file["errors"]}
     assert "null value not allowed" in messages
     assert "must be of boolean type" in messages
-    tasks = {err["task_name"] for err in acl_file["errors"]}
+    tasks = {err.get("task_name") for err in acl_file["errors"]}
     assert "test_task" in tasks
 
 
@@ -59,8 +59,8 @@ def test_parse_handles_missing_fields_and_ipynb():
     entry = parsed[0]
     assert entry["file_type"] == "ipynb"
     err = entry["errors"][0]
-    assert err["yaml_key"] is None
-    assert err["task_name"] is None
+    assert "yaml_key" not in err
+    assert err.get("task_name") is None
     assert err["message"] == "Traceback line"
 
 
@@ -75,3 +75,15 @@ def test_parse_cli_block_with_timestamped_prefix():
     entry = parsed[0]
     assert entry["file_path"] == "cli.py"
     assert entry["errors"][0]["tag"] == "CLI_DAG_VALIDATION_FAILED"
+
+
+def test_parse_keeps_colons_in_values_and_label_precedence():
+    raw = """\
+[DAG_VALIDATION_ERROR_BASE_LEVEL] | File Name: validator.py
+  ├─ Error Message: invalid value: expected true or false
+  ├─ Technical Message: ignored because Error Message wins
+  └─ Yaml File: C:/repo/acl.yaml
+"""
+    parsed = parse_validation_output(raw)
+    assert [entry["file_path"] for entry in parsed] == ["C:/repo/acl.yaml"]
+    assert parsed[0]["errors"][0]["message"] == "invalid value: expected true or false"